@@ -44,14 +44,32 @@ from .config import (
 )
 from .logger import setup_logging
 from .ping_manager import run_ping_monitoring
-from .plot_generator import display_plots_and_summary
 from .utils import (
     handle_clear_operations,
     validate_and_get_ips,
     create_results_directory,
     ask_confirmation,
 )
-from .data_processing import process_file_mode, process_ping_results
+
+# The plotting and data processing modules pull in matplotlib, seaborn and pandas,
+# which dominate start-up time. They are only imported when first accessed so that
+# `nlm --help`, config regeneration and clear operations stay fast.
+_LAZY_EXPORTS = {
+    "display_plots_and_summary": ".plot_generator",
+    "process_file_mode": ".data_processing",
+    "process_ping_results": ".data_processing",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "parse_arguments",
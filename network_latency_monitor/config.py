@@ -13,9 +13,14 @@ Functions:
     - get_standard_directories: Retrieves standard directories based on the operating system.
 """
 
+import copy
+import os
 import sys
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
 import yaml
 from appdirs import AppDirs
@@ -24,8 +29,14 @@ from loguru import logger  # Use Loguru's logger
 
 from network_latency_monitor.console_manager import console_proxy  # Use custom console
 
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper, SafeLoader
+
 # Define the default configuration dictionary
-DEFAULT_CONFIG = {
+_DEFAULT_CONFIG = {
     "duration": 10800,  # in seconds
     "ip_addresses": ["8.8.8.8"],
     "ping_interval": 1,  # in seconds
@@ -40,17 +51,66 @@ DEFAULT_CONFIG = {
     "yes": False,  # Set to True to auto-confirm prompts
     "verbosity": 0,  # 0: Normal, 1: Verbose, 2: Debug
 }
+# Read-only view shared by all callers; copy it with dict() before modifying
+DEFAULT_CONFIG = MappingProxyType(_DEFAULT_CONFIG)
+
+# DEFAULT_CONFIG serialized once; written verbatim when (re)creating config.yaml
+_DEFAULT_CONFIG_YAML = yaml.dump(
+    _DEFAULT_CONFIG, Dumper=SafeDumper, sort_keys=False, encoding="utf-8"
+)
+
+# Directories created on startup; data_dir is the parent of plots_dir, results_dir
+# and cache_dir
+LEAF_DIRECTORY_KEYS = ("log_dir", "plots_dir", "results_dir", "cache_dir")
+DIRECTORY_MODE = 0o700  # Ping results and logs reveal monitored hosts
+
+# Parsed YAML files keyed by path, validated against (st_mtime_ns, st_size)
+YAML_CACHE_MAXSIZE = 100
+_yaml_cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+
 
+def _load_yaml_cached(config_path: Path) -> Dict[str, Any]:
+    """
+    Parse a YAML file, reusing the previous result if the file is unchanged.
+
+    Entries are validated against the file's modification time and size and
+    evicted least-recently-used once more than YAML_CACHE_MAXSIZE files are cached.
 
+    Args:
+        config_path (Path): Path to the YAML file.
+
+    Returns:
+        Dict[str, Any]: A fresh copy of the parsed mapping (empty if the file is empty).
+    """
+    stat = os.stat(config_path)
+    key = str(config_path)
+    cached = _yaml_cache.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        _yaml_cache.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    with config_path.open("r", encoding="utf-8") as f:
+        parsed = yaml.load(f, Loader=SafeLoader) or {}
+    _yaml_cache[key] = (stat.st_mtime_ns, stat.st_size, parsed)
+    _yaml_cache.move_to_end(key)
+    if len(_yaml_cache) > YAML_CACHE_MAXSIZE:
+        _yaml_cache.popitem(last=False)
+    return copy.deepcopy(parsed)
+
+
+@lru_cache(maxsize=8)
 def get_standard_directories(app_name: str) -> Dict[str, Path]:
     """
     Retrieve standard directories based on the operating system.
 
+    The result is cached per app_name; treat the returned dictionary as read-only.
+
     Args:
         app_name (str): The name of the application.
 
     Returns:
-        Dict[str, Path]: Paths for config_dir, data_dir, log_dir, plots_dir, and results_dir.
+        Dict[str, Path]: Paths for config_dir, data_dir, log_dir, plots_dir, results_dir,
+            and cache_dir.
     """
     dirs = AppDirs(app_name)
     config_dir = Path(dirs.user_config_dir)
@@ -58,15 +118,49 @@ def get_standard_directories(app_name: str) -> Dict[str, Path]:
     log_dir = Path(dirs.user_log_dir)
     plots_dir = data_dir / "plots"
     results_dir = data_dir / "results"
+    cache_dir = data_dir / "cache"
     return {
         "config_dir": config_dir,
         "data_dir": data_dir,
         "log_dir": log_dir,
         "plots_dir": plots_dir,
         "results_dir": results_dir,
+        "cache_dir": cache_dir,
     }
 
 
+def _ensure_directories(dirs: Dict[str, Path]) -> None:
+    """
+    Create the log, plots, results, and cache directories if they do not exist.
+
+    Only the leaf directories are created, readable by the current user alone;
+    parents such as data_dir come along via parents=True, and an existing
+    directory is detected from the mkdir error rather than a separate stat call.
+
+    Args:
+        dirs (Dict[str, Path]): Directories as returned by get_standard_directories.
+
+    Exits:
+        SystemExit: If a directory cannot be created.
+    """
+    for key in LEAF_DIRECTORY_KEYS:
+        path = dirs[key]
+        try:
+            path.mkdir(mode=DIRECTORY_MODE, parents=True)
+        except FileExistsError:
+            continue
+        except OSError as e:
+            console_proxy.console.print(
+                f"[bold red]Failed to create directory '{path}' for '{key}': {e}[/bold red]"
+            )
+            logger.error(f"Failed to create directory '{path}' for '{key}': {e}")
+            sys.exit(1)
+        console_proxy.console.print(
+            f"[bold green]Created directory '{path}' for '{key}'.[/bold green]"
+        )
+        logger.info(f"Created directory '{path}' for '{key}'.")
+
+
 def load_config(config_file: str = "config.yaml") -> Dict:
     """
     Load configuration from a YAML file. Create one with default settings if it does not exist.
@@ -77,7 +171,6 @@ def load_config(config_file: str = "config.yaml") -> Dict:
     Returns:
         Dict: Configuration dictionary.
     """
-    config = DEFAULT_CONFIG.copy()
     app_name = "network_latency_monitor"  # Replace with your actual application name
     dirs = get_standard_directories(app_name)
     config_dir = dirs["config_dir"]
@@ -85,14 +178,14 @@ def load_config(config_file: str = "config.yaml") -> Dict:
     log_dir = dirs["log_dir"]
     plots_dir = dirs["plots_dir"]
     results_dir = dirs["results_dir"]
+    cache_dir = dirs["cache_dir"]
 
     config_path = config_dir / config_file
 
     if config_path.exists():
         logger.info(f"Loading existing configuration from '{config_path}'.")
         try:
-            with config_path.open("r", encoding="utf-8") as f:
-                user_config = yaml.safe_load(f) or {}
+            user_config = _load_yaml_cached(config_path)
             # Merge user_config into DEFAULT_CONFIG
             config = {**DEFAULT_CONFIG, **user_config}
             logger.info("Configuration loaded successfully.")
@@ -101,24 +194,23 @@ def load_config(config_file: str = "config.yaml") -> Dict:
                 f"[bold red]Error parsing the config file: {e}[/bold red]"
             )
             logger.error(f"Error parsing the config file: {e}")
-            config = DEFAULT_CONFIG.copy()
+            config = dict(DEFAULT_CONFIG)
         except Exception as e:
             console_proxy.console.print(
                 f"[bold red]Unexpected error loading config file '{config_path}': {e}[/bold red]"
             )
             logger.error(f"Unexpected error loading config file '{config_path}': {e}")
-            config = DEFAULT_CONFIG.copy()
+            config = dict(DEFAULT_CONFIG)
     else:
         # Create config.yaml with default settings
         try:
             config_dir.mkdir(parents=True, exist_ok=True)
-            with config_path.open("w", encoding="utf-8") as f:
-                yaml.dump(DEFAULT_CONFIG, f, sort_keys=False)
+            config_path.write_bytes(_DEFAULT_CONFIG_YAML)
             console_proxy.console.print(
                 f"[bold green]Default configuration file created at '{config_path}'. Please review and modify it as needed.[/bold green]"
             )
             logger.info(f"Default configuration file created at '{config_path}'.")
-            config = DEFAULT_CONFIG.copy()
+            config = dict(DEFAULT_CONFIG)
         except Exception as e:
             console_proxy.console.print(
                 f"[bold red]Failed to create default config file '{config_path}': {e}[/bold red]"
@@ -127,21 +219,7 @@ def load_config(config_file: str = "config.yaml") -> Dict:
             sys.exit(1)
 
     # Ensure data directories exist
-    for key in ["data_dir", "log_dir", "plots_dir", "results_dir"]:
-        path = dirs[key]
-        if not path.exists():
-            try:
-                path.mkdir(parents=True, exist_ok=True)
-                console_proxy.console.print(
-                    f"[bold green]Created directory '{path}' for '{key}'.[/bold green]"
-                )
-                logger.info(f"Created directory '{path}' for '{key}'.")
-            except Exception as e:
-                console_proxy.console.print(
-                    f"[bold red]Failed to create directory '{path}' for '{key}': {e}[/bold red]"
-                )
-                logger.error(f"Failed to create directory '{path}' for '{key}': {e}")
-                sys.exit(1)
+    _ensure_directories(dirs)
 
     # Add directory paths to config (do not write these to config.yaml)
     config["config_dir"] = config_dir
@@ -149,17 +227,39 @@ def load_config(config_file: str = "config.yaml") -> Dict:
     config["log_dir"] = log_dir
     config["plots_dir"] = plots_dir
     config["results_dir"] = results_dir
+    config["cache_dir"] = cache_dir
 
     return config
 
 
-def regenerate_default_config(config_file: str = "config.yaml", config: Dict = None):
+def _prompt_confirm(message: str) -> bool:
+    """
+    Ask the user a yes/no question with Rich's Prompt, defaulting to "n".
+
+    Args:
+        message (str): The question to display.
+
+    Returns:
+        bool: True if the user answered yes.
+    """
+    confirmation = Prompt.ask(message, choices=["y", "n"], default="n")
+    return confirmation.lower() in ["y", "yes"]
+
+
+def regenerate_default_config(
+    config_file: str = "config.yaml",
+    config: Dict = None,
+    *,
+    confirm: Optional[Callable[[str], bool]] = None,
+):
     """
     Regenerate the config.yaml file with default settings after user confirmation.
 
     Args:
         config_file (str, optional): Path to the config file. Defaults to "config.yaml".
         config (Dict, optional): Configuration dictionary. Used to check for auto-confirmation.
+        confirm (Callable[[str], bool], optional): Asks whether to overwrite an existing
+            config file. Defaults to an interactive Rich prompt.
     """
     app_name = "network_latency_monitor"  # Replace with your actual application name
     dirs = get_standard_directories(app_name)
@@ -169,16 +269,14 @@ def regenerate_default_config(config_file: str = "config.yaml", config: Dict = N
     if config_path.exists():
         # Check if auto-confirm is enabled
         if config and config.get("yes", False):
-            confirmation = "y"
+            confirmed = True
             logger.debug("Auto-confirmation enabled. Proceeding without prompt.")
         else:
             # Prompt for confirmation
-            confirmation = Prompt.ask(
-                f"[bold yellow]Are you sure you want to regenerate the default '{config_path}'? This will overwrite your current configuration.[/bold yellow]",
-                choices=["y", "n"],
-                default="n",
+            confirmed = (confirm or _prompt_confirm)(
+                f"[bold yellow]Are you sure you want to regenerate the default '{config_path}'? This will overwrite your current configuration.[/bold yellow]"
             )
-        if confirmation.lower() not in ["y", "yes"]:
+        if not confirmed:
             console_proxy.console.print(
                 "[bold green]Configuration regeneration canceled.[/bold green]"
             )
@@ -188,8 +286,7 @@ def regenerate_default_config(config_file: str = "config.yaml", config: Dict = N
     # Create config.yaml with default settings
     try:
         config_dir.mkdir(parents=True, exist_ok=True)
-        with config_path.open("w", encoding="utf-8") as f:
-            yaml.dump(DEFAULT_CONFIG, f, sort_keys=False)
+        config_path.write_bytes(_DEFAULT_CONFIG_YAML)
         console_proxy.console.print(
             f"[bold green]Default configuration file regenerated at '{config_path}'. Please review and modify it as needed.[/bold green]"
         )
@@ -202,66 +299,98 @@ def regenerate_default_config(config_file: str = "config.yaml", config: Dict = N
         sys.exit(1)
 
     # Ensure data directories exist
-    for key in ["data_dir", "log_dir", "plots_dir", "results_dir"]:
-        path = dirs[key]
-        if not path.exists():
-            try:
-                path.mkdir(parents=True, exist_ok=True)
-                console_proxy.console.print(
-                    f"[bold green]Created directory '{path}' for '{key}'.[/bold green]"
-                )
-                logger.info(f"Created directory '{path}' for '{key}'.")
-            except Exception as e:
-                console_proxy.console.print(
-                    f"[bold red]Failed to create directory '{path}' for '{key}': {e}[/bold red]"
-                )
-                logger.error(f"Failed to create directory '{path}' for '{key}': {e}")
-                sys.exit(1)
-
-
-def merge_args_into_config(args, config: Dict) -> Dict:
+    _ensure_directories(dirs)
+
+
+# Map CLI argument names to config keys
+_ARG_TO_CONFIG_KEY = {
+    "duration": "duration",
+    "ping_interval": "ping_interval",
+    "latency_threshold": "latency_threshold",
+    "no_aggregation": "no_aggregation",
+    "no_segmentation": "no_segmentation",
+    "file": "file",
+    "clear": "clear",
+    "clear_results": "clear_results",
+    "clear_logs": "clear_logs",
+    "clear_plots": "clear_plots",
+    "yes": "yes",
+}
+
+
+def merge_args_into_config(args, config: Mapping[str, Any]) -> Dict:
     """
     Merge command-line arguments into the configuration dictionary, giving precedence to CLI arguments.
 
+    The given config is not modified, so a shared base such as DEFAULT_CONFIG can be
+    passed without copying it first.
+
     Args:
         args: Parsed command-line arguments.
-        config (Dict): Configuration dictionary.
+        config (Mapping[str, Any]): Configuration dictionary.
 
     Returns:
-        Dict: Updated configuration dictionary with CLI arguments merged in.
+        Dict: New configuration dictionary with CLI arguments merged in.
     """
-    # Map CLI argument names to config keys
-    arg_to_config_map = {
-        "duration": "duration",
-        "ping_interval": "ping_interval",
-        "latency_threshold": "latency_threshold",
-        "no_aggregation": "no_aggregation",
-        "no_segmentation": "no_segmentation",
-        "file": "file",
-        "clear": "clear",
-        "clear_results": "clear_results",
-        "clear_logs": "clear_logs",
-        "clear_plots": "clear_plots",
-        "yes": "yes",
+    overrides = {
+        config_key: arg_value
+        for arg_name, config_key in _ARG_TO_CONFIG_KEY.items()
+        if (arg_value := getattr(args, arg_name, None)) is not None
     }
 
-    for arg_name, config_key in arg_to_config_map.items():
-        arg_value = getattr(args, arg_name, None)
-        if arg_value is not None:
-            config[config_key] = arg_value
-
     # Handle positional arguments like ip_addresses
-    if hasattr(args, "ip_addresses") and args.ip_addresses:
-        config["ip_addresses"] = args.ip_addresses
+    if getattr(args, "ip_addresses", None):
+        overrides["ip_addresses"] = args.ip_addresses
 
     # Handle verbosity and quiet flags from CLI
-    if hasattr(args, "quiet") and args.quiet:
-        config["verbosity"] = -1  # Special value for Quiet Mode
-    elif hasattr(args, "verbose") and args.verbose > 0:
-        config["verbosity"] = min(args.verbose, 2)  # Cap at 2 for Debug Mode
+    if getattr(args, "quiet", False):
+        overrides["verbosity"] = -1  # Special value for Quiet Mode
+    elif getattr(args, "verbose", 0) > 0:
+        overrides["verbosity"] = min(args.verbose, 2)  # Cap at 2 for Debug Mode
     # If neither quiet nor verbose flags are set, retain config file's verbosity
 
-    return config
+    return {**config, **overrides}
+
+
+def _die(message: str, log_message: Optional[str] = None) -> None:
+    """
+    Report a configuration error on the console and in the log, then exit.
+
+    Args:
+        message (str): Error message shown on the console.
+        log_message (str, optional): Message written to the log. Defaults to message.
+
+    Exits:
+        SystemExit: Always, with exit code 1.
+    """
+    console_proxy.console.print(f"[bold red]{message}[/bold red]")
+    logger.error(log_message or message)
+    sys.exit(1)
+
+
+# (key, predicate on the configured value, error message) checked by validate_config
+_RULES: Tuple[Tuple[str, Callable[[Any], bool], str], ...] = (
+    (
+        "duration",
+        lambda v: isinstance(v, int) and v > 0,
+        "Invalid duration in configuration.",
+    ),
+    (
+        "ping_interval",
+        lambda v: isinstance(v, int) and v > 0,
+        "Invalid ping_interval in configuration.",
+    ),
+    (
+        "latency_threshold",
+        lambda v: isinstance(v, (float, int)) and v > 0,
+        "Invalid latency_threshold in configuration.",
+    ),
+    (
+        "ip_addresses",
+        lambda v: isinstance(v, list) and bool(v),
+        "No IP addresses specified in configuration.",
+    ),
+)
 
 
 def validate_config(config: Dict) -> None:
@@ -274,51 +403,17 @@ def validate_config(config: Dict) -> None:
     Exits:
         SystemExit: If any validation fails or directory creation encounters an error.
     """
-    # Validate duration
-    if not isinstance(config.get("duration"), int) or config["duration"] <= 0:
-        console_proxy.console.print(
-            "[bold red]Invalid duration in configuration.[/bold red]"
-        )
-        logger.error("Invalid duration in configuration.")
-        sys.exit(1)
-
-    # Validate ping_interval
-    if not isinstance(config.get("ping_interval"), int) or config["ping_interval"] <= 0:
-        console_proxy.console.print(
-            "[bold red]Invalid ping_interval in configuration.[/bold red]"
-        )
-        logger.error("Invalid ping_interval in configuration.")
-        sys.exit(1)
-
-    # Validate latency_threshold
-    if (
-        not isinstance(config.get("latency_threshold"), (float, int))
-        or config["latency_threshold"] <= 0
-    ):
-        console_proxy.console.print(
-            "[bold red]Invalid latency_threshold in configuration.[/bold red]"
-        )
-        logger.error("Invalid latency_threshold in configuration.")
-        sys.exit(1)
-
-    # Validate ip_addresses
-    if not isinstance(config.get("ip_addresses"), list) or not config["ip_addresses"]:
-        console_proxy.console.print(
-            "[bold red]No IP addresses specified in configuration.[/bold red]"
-        )
-        logger.error("No IP addresses specified in configuration.")
-        sys.exit(1)
+    for key, is_valid, message in _RULES:
+        if not is_valid(config.get(key)):
+            _die(message)
 
-    # Validate verbosity
+    # Validate verbosity; -1 is Quiet Mode
     verbosity = config.get("verbosity", 0)
-    if verbosity == -1:
-        # Quiet Mode
-        pass  # No additional validation needed
-    elif not isinstance(verbosity, int) or not (0 <= verbosity <= 2):
-        console_proxy.console.print(
-            "[bold red]Invalid verbosity level in configuration. Must be 0 (Normal), 1 (Verbose), or 2 (Debug). Use -q for Quiet Mode.[/bold red]"
+    if verbosity != -1 and (
+        not isinstance(verbosity, int) or not (0 <= verbosity <= 2)
+    ):
+        _die(
+            "Invalid verbosity level in configuration. Must be 0 (Normal), 1 (Verbose), or 2 (Debug). Use -q for Quiet Mode.",
+            "Invalid verbosity level in configuration.",
         )
-        logger.error("Invalid verbosity level in configuration.")
-        sys.exit(1)
     # Additional validations can be added here as needed
-
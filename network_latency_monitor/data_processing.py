@@ -13,18 +13,46 @@ Functions:
     - aggregate_ping_times: Aggregates ping times over specified intervals.
     - process_ping_results: Processes all ping result files in a subdirectory.
     - process_ping_file: Processes a single ping result file and generates the corresponding plot.
+    - process_ping_files: Processes several ping result files and plots them together.
 """
 
+import csv
+import hashlib
+import os
+import re
 import sys
-from typing import List, Tuple, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from typing import Any, List, Tuple, Dict, Optional
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from loguru import logger  # Use loguru logger
 
+from network_latency_monitor.config import DIRECTORY_MODE
 from network_latency_monitor.console_manager import console_proxy  # Use custom console
-from .plot_generator import generate_plots
+from .plot_generator import create_plots_subdir, generate_plots
+
+# Markers written to ping result files for lost pings
+LOST_MARKERS = ["lost", "Lost", "LOST"]
+# Lost markers as complete raw lines, for the line-by-line parser
+LOST_TOKENS = frozenset(
+    f"{marker}{ending}".encode()
+    for marker in LOST_MARKERS
+    for ending in ("\n", "\r\n", "")
+)
+
+# Result file names written by the ping manager: ping_results_<ip>.txt
+_IP_FROM_NAME = re.compile(r"^ping_results_(?P<ip>.+)\.txt$")
+
+# Smaller files parse quickly enough that caching them is not worth the disk writes
+PING_CACHE_MIN_PINGS = 10_000
+# Fully lost intervals listed by name in the aggregation warning
+MAX_LISTED_LOST_INTERVALS = 10
+# Combined size of result files from which they are processed in parallel
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
 
 
 def process_file_mode(config: Dict):
@@ -64,129 +92,460 @@ def process_file_mode(config: Dict):
         sys.exit(0)  # Exit after processing file
 
 
-def extract_ping_times(file_path: str) -> List[Optional[float]]:
+def extract_ping_times(file_path: str, cache_dir: Optional[Path] = None) -> np.ndarray:
     """
     Extracts ping times from a given ping result file.
 
-    This function reads a ping result file line by line, parsing each line to extract
-    the latency in milliseconds. If a ping attempt resulted in a loss or an error,
-    the function records it as `None`. The function also logs any unexpected line formats.
+    The file is parsed in a single pass by pandas' C tokenizer, with lost pings
+    converted to `NaN`. Files containing lines that are neither a latency value nor
+    a lost marker (e.g. error messages) fall back to a line-by-line parse that logs
+    each unexpected line.
+
+    If `cache_dir` is given, results of large files are cached there as `.npy`
+    files keyed by the file's path, modification time and size, so unchanged files
+    are not parsed again.
 
     Args:
         file_path (str): Path to the ping result file.
+        cache_dir (Optional[Path]): Directory for cached ping times. Defaults to
+            `None`, which disables caching.
 
     Returns:
-        List[Optional[float]]: A list of ping times in milliseconds. `None` represents
-        lost pings or errors.
+        np.ndarray: A float32 array of ping times in milliseconds. `NaN` represents
+        lost pings or errors. The array is empty if the file could not be read.
 
     Example:
         >>> ping_times = extract_ping_times("results/ping_results_8.8.8.8.txt")
-        >>> print(ping_times)
-        [23.5, 24.1, None, 25.0, ...]
+        >>> print(ping_times.tolist())
+        [23.5, 24.1, nan, 25.0, ...]
     """
-    ping_times: List[Optional[float]] = []
     file_path_obj = Path(file_path)
 
     try:
-        with file_path_obj.open("r", encoding="utf-8") as file:
+        stat = file_path_obj.stat()
+    except OSError:
+        # Let the parser report missing or unreadable files
+        stat = None
+
+    # Skip opening and parsing files with no pings at all
+    if stat is not None and stat.st_size == 0:
+        logger.info(f"Ping result file {file_path_obj} is empty.")
+        return np.empty(0, dtype=np.float32)
+
+    cache_path = None
+    if cache_dir is not None and stat is not None:
+        cache_path = _ping_times_cache_path(cache_dir, file_path_obj, stat)
+
+    if cache_path is not None and cache_path.is_file():
+        try:
+            ping_times = np.load(cache_path)
+            logger.debug(f"Loaded cached ping times for {file_path_obj}.")
+            return ping_times
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable ping cache {cache_path}: {e}")
+
+    ping_times = _parse_ping_times(file_path_obj)
+    if cache_path is not None and ping_times.size >= PING_CACHE_MIN_PINGS:
+        _save_ping_times_cache(cache_path, ping_times)
+    return ping_times
+
+
+def _ping_times_cache_path(
+    cache_dir: Path, file_path_obj: Path, stat: os.stat_result
+) -> Path:
+    """
+    Builds the cache file path for a ping result file.
+
+    The name includes a digest of the file's absolute path, so files with the same
+    name in different directories do not share an entry.
+
+    Args:
+        cache_dir (Path): Directory for cached ping times.
+        file_path_obj (Path): Path to the ping result file.
+        stat (os.stat_result): Result of `stat` on the ping result file.
+
+    Returns:
+        Path: Path of the cache file.
+    """
+    digest = hashlib.sha1(str(file_path_obj.resolve()).encode()).hexdigest()[:16]
+    return (
+        Path(cache_dir)
+        / f"{file_path_obj.name}.{digest}.{stat.st_mtime_ns}.{stat.st_size}.npy"
+    )
+
+
+def _save_ping_times_cache(cache_path: Path, ping_times: np.ndarray) -> None:
+    """
+    Saves parsed ping times to the cache, replacing stale entries for the same file.
+
+    Caching is best effort; failures are logged and otherwise ignored.
+
+    Args:
+        cache_path (Path): Path of the cache file to write.
+        ping_times (np.ndarray): Parsed ping times.
+    """
+    # Strip the ".<mtime_ns>.<size>.npy" suffix to get the "<name>.<digest>" prefix
+    result_prefix = cache_path.name.rsplit(".", 3)[0]
+    try:
+        # Cache file names include the monitored IPs, so keep them private
+        cache_path.parent.mkdir(mode=DIRECTORY_MODE, parents=True, exist_ok=True)
+        for stale in cache_path.parent.glob(f"{result_prefix}.*.npy"):
+            if stale != cache_path:
+                stale.unlink()
+        tmp_path = cache_path.with_suffix(".tmp")
+        with tmp_path.open("wb") as f:
+            np.save(f, ping_times)
+        os.replace(tmp_path, cache_path)
+        logger.debug(f"Cached ping times in {cache_path}.")
+    except OSError as e:
+        logger.debug(f"Could not cache ping times in {cache_path}: {e}")
+
+
+def _parse_ping_times(file_path_obj: Path) -> np.ndarray:
+    """
+    Parses ping times from a ping result file.
+
+    Args:
+        file_path_obj (Path): Path to the ping result file.
+
+    Returns:
+        np.ndarray: A float32 array of ping times in milliseconds, with `NaN` for
+        lost pings or errors. The array is empty if the file could not be read.
+    """
+    try:
+        ping_df = pd.read_csv(
+            file_path_obj,
+            header=None,
+            names=["Ping (ms)"],
+            # Only the lost markers are NaN; pandas' defaults ("NA", "null", blank
+            # lines, ...) are unexpected formats reported by the line parser
+            na_values=LOST_MARKERS,
+            keep_default_na=False,
+            dtype=np.float32,
+            skip_blank_lines=False,
+            quoting=csv.QUOTE_NONE,
+            engine="c",
+        )
+        return ping_df["Ping (ms)"].to_numpy()
+    except FileNotFoundError:
+        logger.error(f"Ping result file {file_path_obj} not found.")
+    except ValueError:
+        # Unexpected line formats; parse line by line so they can be reported
+        logger.debug(f"Falling back to line-by-line parsing for {file_path_obj}.")
+        return _extract_ping_times_by_line(file_path_obj)
+    except Exception as e:
+        logger.error(f"Error extracting ping times from {file_path_obj}: {e}")
+
+    return np.empty(0, dtype=np.float32)
+
+
+def _extract_ping_times_by_line(file_path_obj: Path) -> np.ndarray:
+    """
+    Extracts ping times line by line, logging any unexpected line formats.
+
+    Args:
+        file_path_obj (Path): Path to the ping result file.
+
+    Returns:
+        np.ndarray: A float32 array of ping times in milliseconds, with `NaN` for
+        lost pings or errors.
+    """
+    ping_times: List[float] = []
+
+    try:
+        # Bytes mode: float() parses bytes directly, so no line is decoded or normalized
+        with file_path_obj.open("rb") as file:
             for line in file:
-                line = line.strip()
-                if line.lower() == "lost":
-                    ping_times.append(None)
-                else:
-                    try:
-                        ping_time = float(line)
-                        ping_times.append(ping_time)
-                    except ValueError:
+                if line in LOST_TOKENS:
+                    ping_times.append(np.nan)
+                    continue
+                try:
+                    ping_times.append(float(line))
+                except ValueError:
+                    ping_times.append(np.nan)
+                    stripped = line.strip()
+                    if stripped.lower() != b"lost":
                         # Handle unexpected line format
-                        ping_times.append(None)
                         logger.warning(
-                            f"Unexpected line format in {file_path_obj}: {line}"
+                            f"Unexpected line format in {file_path_obj}: {stripped.decode('utf-8', 'replace')}"
                         )
-    except FileNotFoundError:
-        logger.error(f"Ping result file {file_path_obj} not found.")
     except Exception as e:
         logger.error(f"Error extracting ping times from {file_path_obj}: {e}")
 
-    return ping_times
+    return np.array(ping_times, dtype=np.float32)
 
 
 def aggregate_ping_times(
-    ping_times: List[Optional[float]], interval: int
-) -> List[Tuple[float, float, float]]:
+    ping_times: np.ndarray, interval: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Aggregates ping times over specified intervals.
 
     This function groups ping times into intervals and calculates the mean latency
-    and packet loss percentage for each interval. If all pings in an interval are lost,
-    it logs a warning and sets the mean latency to 0.0 ms.
+    and packet loss percentage for each interval. Each interval, including a shorter
+    trailing one, is reduced in a single `np.add.reduceat` pass, so no Python-level
+    loop runs over individual pings. Intervals where all pings are lost have their
+    mean latency set to 0.0 ms and are reported together in a single warning.
 
     Args:
-        ping_times (List[Optional[float]]): A list of ping times in milliseconds. `None` represents
-            lost pings or errors.
+        ping_times (np.ndarray): A float32 array of ping times in milliseconds. `NaN`
+            represents lost pings or errors.
         interval (int): The number of ping attempts to aggregate into a single interval.
 
     Returns:
-        List[Tuple[float, float, float]]: A list of tuples containing:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Three float32 arrays with one entry per interval:
             - Midpoint time of the interval in seconds.
             - Mean latency in milliseconds.
             - Packet loss percentage.
 
     Example:
-        >>> ping_times = [23.5, 24.1, None, 25.0, 26.2, None]
-        >>> aggregated = aggregate_ping_times(ping_times, 3)
-        >>> print(aggregated)
-        [(1.5, 24.2, 33.33333333333333), (4.5, 25.6, 33.33333333333333)]
-    """
-
-    aggregated_data = []
-    total_intervals = len(ping_times) // interval
-
-    for i in range(total_intervals):
-        start = i * interval
-        end = start + interval
-        interval_pings = ping_times[start:end]
-        successful_pings = [pt for pt in interval_pings if pt is not None]
-        lost_pings = len(interval_pings) - len(successful_pings)
-        packet_loss = (lost_pings / interval) * 100 if interval > 0 else 0
-
-        if successful_pings:
-            mean_latency = sum(successful_pings) / len(successful_pings)
-        else:
-            mean_latency = 0.0  # Indicate all pings lost
-            logger.warning(
-                f"All pings lost in interval {start}-{end} seconds. Mean Latency set to 0.0 ms."
-            )
+        >>> ping_times = np.array([23.5, 24.1, np.nan, 25.0, 26.2, np.nan], dtype=np.float32)
+        >>> midpoints, mean_latency, packet_loss = aggregate_ping_times(ping_times, 3)
+        >>> print(midpoints, mean_latency, packet_loss)
+        [1.5 4.5] [23.8 25.6] [33.33333333 33.33333333]
+    """
+    arr = np.asarray(ping_times, dtype=np.float32)
 
-        midpoint_time = start + (interval / 2)
-        aggregated_data.append((midpoint_time, mean_latency, packet_loss))
+    # Interval boundaries; the last interval holds any remaining pings
+    starts = np.arange(0, arr.size, interval)
+    sizes = np.diff(np.append(starts, arr.size))
 
-    # Handle remaining pings
-    remaining_pings = ping_times[total_intervals * interval :]
-    if remaining_pings:
-        successful_pings = [pt for pt in remaining_pings if pt is not None]
-        lost_pings = len(remaining_pings) - len(successful_pings)
-        packet_loss = (
-            (lost_pings / len(remaining_pings)) * 100 if len(remaining_pings) > 0 else 0
+    successful = ~np.isnan(arr)
+    counts = np.add.reduceat(successful.astype(np.int64), starts)
+    sums = np.add.reduceat(np.where(successful, arr, 0.0), starts, dtype=np.float64)
+
+    mean_latency = np.divide(
+        sums, counts, out=np.zeros(len(starts), dtype=np.float64), where=counts > 0
+    )
+    packet_loss = (sizes - counts) * 100.0 / sizes
+    midpoints = starts + sizes / 2
+    # Reduce in float64 for accuracy, store in float32 like the raw ping times
+    midpoints, mean_latency, packet_loss = (
+        values.astype(np.float32) for values in (midpoints, mean_latency, packet_loss)
+    )
+
+    # Report all fully lost intervals in a single warning
+    all_lost = np.flatnonzero(counts == 0)
+    if all_lost.size:
+        listed = ", ".join(
+            f"{int(starts[i])}-{int(starts[i] + sizes[i])}"
+            for i in all_lost[:MAX_LISTED_LOST_INTERVALS]
+        )
+        if all_lost.size > MAX_LISTED_LOST_INTERVALS:
+            listed += f", and {all_lost.size - MAX_LISTED_LOST_INTERVALS} more"
+        logger.warning(
+            f"All pings lost in {all_lost.size} interval(s) (seconds {listed}). Mean Latency set to 0.0 ms."
         )
 
-        if successful_pings:
-            mean_latency = sum(successful_pings) / len(successful_pings)
-        else:
-            mean_latency = 0.0
-            logger.warning(
-                f"All pings lost in remaining interval {total_intervals * interval}-{total_intervals * interval + len(remaining_pings)} seconds. Mean Latency set to 0.0 ms."
+    return midpoints, mean_latency, packet_loss
+
+
+def _load_ping_file(
+    file_path: str, aggregate: bool, cache_dir: Optional[Path] = None
+) -> Tuple[np.ndarray, Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]]:
+    """
+    Extracts and optionally aggregates the ping times of a single result file.
+
+    Defined at module level so it can be sent to worker processes.
+
+    Args:
+        file_path (str): Path to the ping result file.
+        aggregate (bool): Whether to aggregate the ping times over 60-second intervals.
+        cache_dir (Optional[Path]): Directory for cached ping times, or `None`.
+
+    Returns:
+        Tuple[np.ndarray, Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]]:
+        The ping times, and the output of `aggregate_ping_times` or `None` if the
+        file was not aggregated.
+    """
+    ping_times = extract_ping_times(file_path, cache_dir)
+    if not aggregate or ping_times.size == 0:
+        return ping_times, None
+    return ping_times, aggregate_ping_times(ping_times, interval=60)
+
+
+# Log messages of the current task in a worker process, as (level, message) pairs
+_worker_messages: List[Tuple[str, str]] = []
+
+
+def _init_worker() -> None:
+    """
+    Makes a worker process collect its log messages instead of writing them.
+
+    Workers started with spawn or forkserver get a fresh loguru logger that writes
+    everything to stderr, and none of them can reach the run's log file. The
+    collected messages are returned with each result and logged by the parent
+    through its configured sinks and levels.
+    """
+    logger.remove()
+    logger.add(
+        lambda message: _worker_messages.append(
+            (message.record["level"].name, message.record["message"])
+        ),
+        level="DEBUG",
+        format="{message}",
+    )
+
+
+def _load_ping_file_in_worker(
+    file_path: str, aggregate: bool, cache_dir: Optional[Path]
+) -> Tuple[
+    Tuple[np.ndarray, Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]],
+    List[Tuple[str, str]],
+]:
+    """
+    Runs `_load_ping_file` in a worker process.
+
+    Args:
+        file_path (str): Path to the ping result file.
+        aggregate (bool): Whether to aggregate the ping times over 60-second intervals.
+        cache_dir (Optional[Path]): Directory for cached ping times, or `None`.
+
+    Returns:
+        The result of `_load_ping_file`, and the (level, message) pairs logged
+        while producing it.
+    """
+    _worker_messages.clear()
+    result = _load_ping_file(file_path, aggregate, cache_dir)
+    return result, list(_worker_messages)
+
+
+def _load_ping_files(
+    file_paths: List[Path], aggregate: bool, cache_dir: Optional[Path] = None
+) -> List[Tuple[np.ndarray, Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]]]:
+    """
+    Loads several ping result files, in parallel worker processes when worthwhile.
+
+    Files are independent, so parsing and aggregation are spread over a process pool
+    when there is more than one file and their combined size is at least
+    `PARALLEL_MIN_BYTES`. Smaller inputs are processed in this process, where the
+    pool start-up cost would dominate. Messages logged by the workers are logged
+    again here, so they go through this process's sinks (see `_init_worker`).
+
+    Args:
+        file_paths (List[Path]): Paths to the ping result files.
+        aggregate (bool): Whether to aggregate the ping times over 60-second intervals.
+        cache_dir (Optional[Path]): Directory for cached ping times, or `None`.
+
+    Returns:
+        List[Tuple[np.ndarray, Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]]]:
+        The result of `_load_ping_file` for each file, in the same order as `file_paths`.
+    """
+    paths = [str(file_path) for file_path in file_paths]
+
+    if len(paths) > 1:
+        try:
+            total_bytes = sum(file_path.stat().st_size for file_path in file_paths)
+        except OSError:
+            total_bytes = 0
+
+        if total_bytes >= PARALLEL_MIN_BYTES:
+            max_workers = min(len(paths), os.cpu_count() or 1)
+            logger.debug(
+                f"Processing {len(paths)} ping result files with {max_workers} worker processes."
             )
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers, initializer=_init_worker
+                ) as executor:
+                    loaded = []
+                    for result, messages in executor.map(
+                        _load_ping_file_in_worker,
+                        paths,
+                        repeat(aggregate),
+                        repeat(cache_dir),
+                    ):
+                        for level, message in messages:
+                            logger.log(level, message)
+                        loaded.append(result)
+                    return loaded
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(
+                    f"Parallel processing failed ({e}). Processing files sequentially."
+                )
+
+    return [_load_ping_file(path, aggregate, cache_dir) for path in paths]
+
+
+def _build_ping_data(
+    ping_times: np.ndarray,
+    aggregated: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+    ip_address: str,
+) -> Dict[str, Any]:
+    """
+    Builds the `data_dict` entry of an IP address used for plotting and summaries.
+
+    Besides the DataFrames, the entry caches the maximum plotted value of each series
+    so `generate_plots` can size the y-axis without rescanning the columns.
+
+    Args:
+        ping_times (np.ndarray): Ping times in milliseconds, with `NaN` for lost pings.
+        aggregated (Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]):
+            Output of `aggregate_ping_times`, or `None` if aggregation is disabled.
+        ip_address (str): IP address the ping times belong to, used for logging.
+
+    Returns:
+        Dict[str, Any]: A dictionary with:
+            - 'raw': DataFrame with 'Time (s)' and 'Ping (ms)' columns.
+            - 'aggregated': DataFrame with 'Time (s)', 'Mean Latency (ms)' and
+              'Packet Loss (%)' columns, or `None`.
+            - 'raw_max': Maximum raw latency as plotted, with lost pings drawn at 800 ms.
+            - 'agg_max': Maximum mean latency, or 0.0 without aggregated data.
+    """
+    if aggregated is not None:
+        midpoints, mean_latency, packet_loss = aggregated
+        agg_df: Optional[pd.DataFrame] = pd.DataFrame(
+            {
+                "Time (s)": midpoints,
+                "Mean Latency (ms)": mean_latency,
+                "Packet Loss (%)": packet_loss,
+            }
+        )
+        logger.debug(f"Aggregated data for {ip_address}: {agg_df.head()}")
+    else:
+        agg_df = None
 
-        midpoint_time = total_intervals * interval + (len(remaining_pings) / 2)
-        aggregated_data.append((midpoint_time, mean_latency, packet_loss))
+    # Convert raw ping times to DataFrame
+    raw_df = pd.DataFrame(
+        {
+            "Time (s)": np.arange(1, ping_times.size + 1, dtype=np.int32),
+            "Ping (ms)": ping_times,
+        }
+    )
 
-    return aggregated_data
+    # Lost pings are drawn at the 800 ms cap, so they set the maximum when present
+    if np.isnan(ping_times).any():
+        raw_max = 800.0
+    else:
+        raw_max = min(float(ping_times.max()), 800.0)
+    agg_max = float(agg_df["Mean Latency (ms)"].max()) if agg_df is not None else 0.0
+
+    return {"raw": raw_df, "aggregated": agg_df, "raw_max": raw_max, "agg_max": agg_max}
 
 
-def process_ping_results(
-    results_subfolder, config
-) -> Dict[str, Dict[str, pd.DataFrame]]:
+def _ip_from_filename(file_path_obj: Path) -> str:
+    """
+    Extracts the IP address from a ping result file name.
+
+    Args:
+        file_path_obj (Path): Path to a ping result file, normally `ping_results_<ip>.txt`.
+
+    Returns:
+        str: The IP address. For files that do not follow the naming scheme, the third
+        underscore-separated part of the file stem, or the whole stem if there is none.
+    """
+    match = _IP_FROM_NAME.match(file_path_obj.name)
+    if match:
+        return match.group("ip")
+
+    logger.warning(
+        f"Unexpected ping result file name {file_path_obj.name}. Guessing the IP address."
+    )
+    parts = file_path_obj.stem.split("_")
+    return parts[2] if len(parts) > 2 else file_path_obj.stem
+
+
+def process_ping_results(results_subfolder, config) -> Dict[str, Dict[str, Any]]:
     """
     Processes all ping result files in a specified subdirectory.
 
@@ -199,8 +558,9 @@ def process_ping_results(
         config (Dict): Configuration dictionary containing settings like duration and aggregation flags.
 
     Returns:
-        Dict[str, Dict[str, pd.DataFrame]]: A nested dictionary where each key is an IP address,
-        and its value is another dictionary with 'raw' and 'aggregated' DataFrames.
+        Dict[str, Dict[str, Any]]: A nested dictionary where each key is an IP address,
+        and its value is another dictionary with 'raw' and 'aggregated' DataFrames and
+        the cached 'raw_max' and 'agg_max' values.
 
     Example:
         >>> data = process_ping_results("results/results_2023-10-05_12-00-00", config)
@@ -216,22 +576,22 @@ def process_ping_results(
         if f.is_file() and f.name.startswith("ping_results_") and f.suffix == ".txt"
     ]
 
-    for file_path_obj in ip_files:
-        file_path = str(
-            file_path_obj
-        )  # Convert Path object back to string for compatibility
+    # Determine if aggregation should be enforced based on duration
+    duration = config.get("duration", 10800)
+    aggregate = duration >= 60 and not config.get("no_aggregation", False)
+
+    loaded = _load_ping_files(ip_files, aggregate)
+
+    for file_path_obj, (ping_times, aggregated) in zip(ip_files, loaded):
         # Extract IP address from filename
-        ip_address = file_path_obj.stem[len("ping_results_") :]
-        ping_times = extract_ping_times(file_path)
-        if not ping_times:
+        ip_address = _ip_from_filename(file_path_obj)
+        if ping_times.size == 0:
             console_proxy.console.print(
                 f"[bold red]No ping times extracted from {file_path_obj}. Skipping.[/bold red]"
             )
             logger.warning(f"No ping times extracted from {file_path_obj}. Skipping.")
             continue
 
-        # Determine if aggregation should be enforced based on duration
-        duration = config.get("duration", 10800)
         if duration < 60:
             console_proxy.console.print(
                 f"[bold yellow]Duration ({duration}s) is less than 60 seconds. Aggregation disabled for {ip_address}.[/bold yellow]"
@@ -239,32 +599,9 @@ def process_ping_results(
             logger.info(
                 f"Duration ({duration}s) is less than 60 seconds. Aggregation disabled for {ip_address}."
             )
-            aggregate = False
-        else:
-            aggregate = not config.get("no_aggregation", False)
-
-        if aggregate:
-            aggregated_data = aggregate_ping_times(ping_times, interval=60)
-            agg_df: Optional[pd.DataFrame] = pd.DataFrame(
-                aggregated_data,
-                columns=["Time (s)", "Mean Latency (ms)", "Packet Loss (%)"],
-            )
-            # Ensure no NaN values in agg_df
-            agg_df["Mean Latency (ms)"] = agg_df["Mean Latency (ms)"].fillna(0.0)
-            agg_df["Packet Loss (%)"] = agg_df["Packet Loss (%)"].fillna(
-                100.0
-            )  # If packet loss is NaN, assume 100%
-            logger.debug(f"Aggregated data for {ip_address}: {agg_df.head()}")
-        else:
-            agg_df = None
-
-        # Convert raw ping times to DataFrame
-        raw_df = pd.DataFrame(
-            {"Time (s)": range(1, len(ping_times) + 1), "Ping (ms)": ping_times}
-        )
 
         # Store data
-        data_dict[ip_address] = {"raw": raw_df, "aggregated": agg_df}
+        data_dict[ip_address] = _build_ping_data(ping_times, aggregated, ip_address)
         logger.info(f"Processed ping results for IP: {ip_address}")
 
     return data_dict
@@ -280,9 +617,7 @@ def process_ping_file(
     """
     Processes a single ping result file and generates the corresponding plot.
 
-    This function reads ping results from a specified file, extracts and aggregates the
-    data based on configuration settings, and generates visual plots using matplotlib.
-    It also creates a timestamped subdirectory to store the generated plots.
+    Thin wrapper around `process_ping_files` for a single file.
 
     Args:
         file_path (str): Path to the ping result file.
@@ -290,76 +625,81 @@ def process_ping_file(
         no_aggregation (bool): Flag to disable data aggregation.
         duration (int): Total duration of the ping monitoring in seconds.
         latency_threshold (float): Latency threshold in milliseconds for highlighting high latency regions.
+    """
+    process_ping_files([file_path], config, no_aggregation, duration, latency_threshold)
 
-    Raises:
-        FileNotFoundError: If the specified ping result file does not exist.
-        Exception: For any other errors that occur during processing.
+
+def process_ping_files(
+    file_paths: List[str],
+    config: dict,
+    no_aggregation: bool,
+    duration: int,
+    latency_threshold: float,
+) -> None:
     """
-    ip_address = Path(file_path).stem.split("_")[2]  # Extract IP from filename
-    ping_times = extract_ping_times(file_path)
+    Processes several ping result files and plots them together.
 
-    if not ping_times:
-        logger.warning(f"No ping times extracted from {file_path}. Skipping plot.")
-        return
+    This function reads ping results from each file, extracts and aggregates the
+    data based on configuration settings, and then generates the plots for all IP
+    addresses in a single `generate_plots` call, in one timestamped subdirectory of
+    the configured plots directory.
+
+    Parsed ping times of large files are cached in the configured `cache_dir`, if
+    any, so processing the same file again is faster. Monitoring runs do not cache,
+    since their results are processed only once.
 
+    Args:
+        file_paths (List[str]): Paths to the ping result files.
+        config (Dict): Configuration dictionary containing settings like aggregation flags and folders.
+        no_aggregation (bool): Flag to disable data aggregation.
+        duration (int): Total duration of the ping monitoring in seconds.
+        latency_threshold (float): Latency threshold in milliseconds for highlighting high latency regions.
+
+    Raises:
+        SystemExit: If the plots subdirectory cannot be created.
+
+    Example:
+        >>> process_ping_files(
+        ...     ["results/ping_results_8.8.8.8.txt", "results/ping_results_1.1.1.1.txt"],
+        ...     config,
+        ...     no_aggregation=False,
+        ...     duration=3600,
+        ...     latency_threshold=200.0,
+        ... )
+    """
     # Determine if aggregation should be enforced based on duration
-    if duration < 60:
-        aggregate = False
-        logger.info(
-            f"Duration ({duration}s) is less than 60 seconds. Aggregation disabled for {ip_address}."
-        )
-    else:
-        aggregate = not no_aggregation
+    aggregate = duration >= 60 and not no_aggregation
 
-    if aggregate:
-        aggregated_data = aggregate_ping_times(ping_times, interval=60)
-        agg_df = pd.DataFrame(
-            aggregated_data,
-            columns=["Time (s)", "Mean Latency (ms)", "Packet Loss (%)"],
-        )
-        logger.debug(f"Aggregated data for {ip_address}: {agg_df.head()}")
-    else:
-        agg_df = None
+    data_dict: Dict[str, Dict[str, Any]] = {}
 
-    # Convert raw ping times to DataFrame
-    raw_df = pd.DataFrame(
-        {"Time (s)": range(1, len(ping_times) + 1), "Ping (ms)": ping_times}
+    cache_dir = config.get("cache_dir")
+
+    # Parse and aggregate the files, in worker processes for large batches
+    loaded = _load_ping_files(
+        [Path(file_path) for file_path in file_paths], aggregate, cache_dir
     )
 
-    # Determine dynamic y-axis limit
-    if agg_df is not None and not agg_df.empty:
-        overall_max_ping = max(
-            raw_df["Ping (ms)"].max(), agg_df["Mean Latency (ms)"].max()
-        )
-    else:
-        overall_max_ping = raw_df["Ping (ms)"].max()
+    for file_path, (ping_times, aggregated) in zip(file_paths, loaded):
+        ip_address = _ip_from_filename(Path(file_path))
+        if duration < 60:
+            logger.info(
+                f"Duration ({duration}s) is less than 60 seconds. Aggregation disabled for {ip_address}."
+            )
 
-    # Calculate y_max
-    if overall_max_ping > 800:
-        y_max = 800
-    else:
-        y_max = overall_max_ping * 1.05  # Add 5% padding
+        if ping_times.size == 0:
+            logger.warning(f"No ping times extracted from {file_path}. Skipping plot.")
+            continue
 
-    plt.ylim(0, y_max)
-    logger.debug(f"Set y-axis limit to {y_max} ms for plotting.")
+        data_dict[ip_address] = _build_ping_data(ping_times, aggregated, ip_address)
 
-    # Prepare data dictionary
-    data_dict = {ip_address: {"raw": raw_df, "aggregated": agg_df}}
+    if not data_dict:
+        return
 
-    # Create plot subdirectory using pathlib.Path
-    plots_folder = Path(config.get("plots_folder", "plots"))
-    current_date = pd.Timestamp.now().strftime("%Y-%m-%d_%H-%M-%S")
-    plot_subfolder = plots_folder / f"plots_{current_date}"
-    try:
-        plot_subfolder.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Created plot subdirectory: {plot_subfolder}")
-    except Exception as e:
-        logger.error(f"Failed to create plot subdirectory {plot_subfolder}: {e}")
-        console_proxy.console.print(
-            f"[bold red]Failed to create plot subdirectory {plot_subfolder}: {e}[/bold red]"
-        )
+    # Create the plot subdirectory once and generate the plots into it
+    plots_subdir = create_plots_subdir(config)
+    if plots_subdir is None:
         sys.exit(1)
 
-    # Generate and save the plot
-    generate_plots(config, data_dict, latency_threshold)
-    logger.info(f"Generated plot for IP: {ip_address}")
+    # Generate and save the plots for all IPs at once
+    generate_plots(config, data_dict, latency_threshold, plots_subdir=plots_subdir)
+    logger.info(f"Generated plots for IPs: {', '.join(data_dict)}")
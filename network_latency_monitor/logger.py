@@ -12,13 +12,17 @@ Functions:
     - setup_logging: Configures logging settings with log rotation and appropriate sinks.
 """
 
-from datetime import datetime
 from pathlib import Path
 import sys
+import time
+from typing import Optional
 from loguru import logger
 
+from network_latency_monitor.utils import TIMESTAMP_FORMAT
+
 # Define a module-level flag to implement the Singleton pattern
 _logger_initialized = False
+_log_file: Optional[Path] = None  # Log file opened by the first setup_logging call
 
 
 def setup_logging(
@@ -27,7 +31,7 @@ def setup_logging(
     log_level_console: str = "WARNING",
     rotation: str = "5 MB",
     retention: int = 5,  # Number of backup log files to keep
-) -> None:
+) -> Path:
     """
     Configures the logging settings for the NLM tool with log rotation and appropriate sinks.
 
@@ -38,14 +42,18 @@ def setup_logging(
         rotation (str, optional): Log rotation criteria. Defaults to "5 MB".
         retention (int, optional): Number of backup log files to keep. Defaults to 5.
 
+    Returns:
+        Path: The log file being written to. If logging was already configured,
+            the file opened by the first call.
+
     Raises:
         OSError: If the log directory cannot be created due to permission issues or other OS-related errors.
     """
-    global _logger_initialized
+    global _logger_initialized, _log_file
 
     if _logger_initialized:
         # Prevent re-initializing the logger
-        return
+        return _log_file
 
     try:
         # Create the log directory using pathlib.Path
@@ -53,7 +61,7 @@ def setup_logging(
         log_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate a safe timestamp for the log file name
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        timestamp = time.strftime(TIMESTAMP_FORMAT)
         log_file = log_dir / f"nlm_{timestamp}.log"
 
         # Remove any default Loguru sinks to prevent duplicate logs
@@ -89,6 +97,8 @@ def setup_logging(
         logger.debug("Logging has been configured successfully.")
 
         _logger_initialized = True  # Mark logger as initialized
+        _log_file = log_file
+        return log_file
 
     except OSError as e:
         print(f"Failed to create log directory '{log_folder}': {e}", file=sys.stderr)
@@ -20,13 +20,10 @@ from loguru import logger  # Import Loguru's logger
 
 from network_latency_monitor import (
     create_results_directory,
-    display_plots_and_summary,
     handle_clear_operations,
     load_config,
     merge_args_into_config,
     parse_arguments,
-    process_file_mode,
-    process_ping_results,
     regenerate_default_config,
     run_ping_monitoring,
     setup_logging,
@@ -70,7 +67,7 @@ async def main():
     args = parse_arguments()
 
     # 2. Merge CLI arguments into a temporary config for initial logging setup
-    temp_config = merge_args_into_config(args, DEFAULT_CONFIG.copy())
+    temp_config = merge_args_into_config(args, DEFAULT_CONFIG)
 
     # 3. Determine verbosity level from temporary config
     verbosity = temp_config.get("verbosity", 0)
@@ -134,6 +131,8 @@ async def main():
     # 12. If file mode is enabled, process the file directly
     if config.get("file"):
         logger.info("Processing file mode.")
+        from network_latency_monitor.data_processing import process_file_mode
+
         process_file_mode(config)
         logger.info("File processing completed.")
         sys.exit(0)  # Exit after processing the file
@@ -174,6 +173,9 @@ async def main():
         )
 
     # 17. Process ping results
+    from network_latency_monitor.data_processing import process_ping_results
+    from network_latency_monitor.plot_generator import display_plots_and_summary
+
     data_dict = process_ping_results(results_subfolder, config)
     logger.debug(f"Processed ping results: {data_dict}")
 
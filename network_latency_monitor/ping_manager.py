@@ -7,6 +7,7 @@ Handles the core functionality of pinging IP addresses, managing asynchronous ta
 and providing real-time feedback through progress bars and latency graphs.
 
 Functions:
+    - build_ping_command: Builds the platform-specific single ping command.
     - run_ping: Executes ping commands and records latency.
     - run_ping_monitoring: Initiates ping monitoring for multiple IP addresses with real-time visualizations.
 """
@@ -16,7 +17,7 @@ import re
 import sys
 from collections import deque
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
 import asciichartpy
 from rich.columns import Columns
@@ -36,6 +37,30 @@ from rich.text import Text
 
 console = Console()
 
+IS_WINDOWS = sys.platform.startswith("win")
+
+# Compiled once at import; matches the latency in a single ping reply
+if IS_WINDOWS:
+    LATENCY_REGEX = re.compile(r"time[=<]\s*(\d+\.?\d*)ms")
+else:
+    LATENCY_REGEX = re.compile(r"time\s*=\s*(\d+\.?\d*)\s*ms")
+
+
+def build_ping_command(ip_address: str, interval: int) -> List[str]:
+    """
+    Builds the platform-specific command that sends a single ping.
+
+    Args:
+        ip_address (str): The IP address to ping.
+        interval (int): Timeout for the reply, in seconds.
+
+    Returns:
+        List[str]: The ping command and its arguments.
+    """
+    if IS_WINDOWS:
+        return ["ping", "-n", "1", "-w", str(interval * 1000), ip_address]
+    return ["ping", "-c", "1", "-W", str(interval), ip_address]
+
 
 async def run_ping(
     ip_address: str,
@@ -67,12 +92,7 @@ async def run_ping(
     end_time = start_time + duration
     last_update_time = start_time
 
-    if sys.platform.startswith("win"):
-        ping_cmd = ["ping", "-n", "1", "-w", str(interval * 1000), ip_address]
-        latency_regex = re.compile(r"time[=<]\s*(\d+\.?\d*)ms")
-    else:
-        ping_cmd = ["ping", "-c", "1", "-W", str(interval), ip_address]
-        latency_regex = re.compile(r"time\s*=\s*(\d+\.?\d*)\s*ms")
+    ping_cmd = build_ping_command(ip_address, interval)
 
     while True:
         current_time = loop.time()
@@ -102,7 +122,7 @@ async def run_ping(
                 pass  # Replace with logging.debug(...) if needed
 
             if proc.returncode == 0:
-                match = latency_regex.search(raw_output)
+                match = LATENCY_REGEX.search(raw_output)
                 if match:
                     current_latency = float(match.group(1))
                 else:
@@ -326,12 +346,7 @@ async def run_ping_quiet(
     start_time = loop.time()
     end_time = start_time + duration
 
-    if sys.platform.startswith("win"):
-        ping_cmd = ["ping", "-n", "1", "-w", str(interval * 1000), ip_address]
-        latency_regex = re.compile(r"time[=<]\s*(\d+\.?\d*)ms")
-    else:
-        ping_cmd = ["ping", "-c", "1", "-W", str(interval), ip_address]
-        latency_regex = re.compile(r"time\s*=\s*(\d+\.?\d*)\s*ms")
+    ping_cmd = build_ping_command(ip_address, interval)
 
     while True:
         current_time = loop.time()
@@ -350,7 +365,7 @@ async def run_ping_quiet(
             raw_output = stdout.decode("utf-8").strip()
 
             if proc.returncode == 0:
-                match = latency_regex.search(raw_output)
+                match = LATENCY_REGEX.search(raw_output)
                 if match:
                     current_latency = float(match.group(1))
                 else:
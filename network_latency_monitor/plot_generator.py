@@ -10,21 +10,27 @@ combine both functionalities to present comprehensive results to the user.
 
 Functions:
     - display_summary: Displays summary statistics in a formatted table.
+    - create_plots_subdir: Creates a timestamped subdirectory for plots.
     - generate_plots: Generates latency plots based on configuration and data.
     - display_plots_and_summary: Generates plots and displays summary statistics.
 """
 
-from datetime import datetime, timedelta
+from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
 import pandas as pd
 import seaborn as sns
 from loguru import logger  # Use loguru logger
 from rich.table import Table
 
 from network_latency_monitor.console_manager import console_proxy  # Use custom console
+from network_latency_monitor.utils import get_run_timestamp
 
 
 def display_summary(data_dict: Dict[str, Dict[str, pd.DataFrame]]) -> None:
@@ -61,32 +67,38 @@ def display_summary(data_dict: Dict[str, Dict[str, pd.DataFrame]]) -> None:
     table.add_column("Min Latency (ms)", style="blue")
     table.add_column("Max Latency (ms)", style="blue")
 
-    for ip, data in data_dict.items():
-        ping_series = data["raw"]["Ping (ms)"]
+    if data_dict:
+        # Compute every statistic in one grouped pass over all IPs
+        pings = pd.concat(
+            {ip: data["raw"]["Ping (ms)"] for ip, data in data_dict.items()},
+            names=["IP Address"],
+        )
+        stats = (
+            pings.groupby(level=0, sort=False)
+            .agg(total="size", successful="count", mean="mean", min="min", max="max")
+            .reindex(list(data_dict), fill_value=0)
+        )
+    else:
+        stats = pd.DataFrame(columns=["total", "successful", "mean", "min", "max"])
 
-        total_pings = ping_series.size
-        successful_pings = ping_series.count()
+    for row in stats.itertuples():
+        total_pings = row.total
+        successful_pings = row.successful
         lost_pings = total_pings - successful_pings
         packet_loss = (lost_pings / total_pings) * 100 if total_pings > 0 else 0
 
+        # Format latency values
         if successful_pings > 0:
-            average_latency = ping_series.mean()
-            min_latency = ping_series.min()
-            max_latency = ping_series.max()
+            average_latency_display = f"{row.mean:.2f}"
+            min_latency_display = f"{row.min:.2f}"
+            max_latency_display = f"{row.max:.2f}"
         else:
-            average_latency = "N/A"
-            min_latency = "N/A"
-            max_latency = "N/A"
-
-        # Format latency values
-        average_latency_display = (
-            f"{average_latency:.2f}" if average_latency != "N/A" else "N/A"
-        )
-        min_latency_display = f"{min_latency:.2f}" if min_latency != "N/A" else "N/A"
-        max_latency_display = f"{max_latency:.2f}" if max_latency != "N/A" else "N/A"
+            average_latency_display = "N/A"
+            min_latency_display = "N/A"
+            max_latency_display = "N/A"
 
         table.add_row(
-            ip,
+            row.Index,
             str(total_pings),
             str(successful_pings),
             f"{packet_loss:.2f}%",
@@ -98,11 +110,134 @@ def display_summary(data_dict: Dict[str, Dict[str, pd.DataFrame]]) -> None:
     console_proxy.console.print(table)
 
 
+# Longest mean latency series still drawn with per-point markers
+MAX_MARKED_POINTS = 500
+
+# zlib level for saved PNGs; favours encoding speed over file size
+PNG_COMPRESS_LEVEL = 1
+
+# Figure and Axes reused for every plot, created on first use
+_PLOT_FIGURE: Optional[Tuple[Figure, Axes]] = None
+
+
+def _get_plot_axes() -> Tuple[Figure, Axes]:
+    """
+    Returns the Figure and Axes shared by all latency plots.
+
+    The pair is created on first use and cleared between plots, which avoids
+    building a new figure (fonts, ticks and canvas) for every saved plot. The
+    figure is attached directly to an Agg canvas rather than created through
+    pyplot, so it is never registered with pyplot's figure manager or a GUI backend.
+
+    Returns:
+        Tuple[Figure, Axes]: The shared Figure and its Axes.
+    """
+    global _PLOT_FIGURE
+    if _PLOT_FIGURE is None:
+        fig = Figure(figsize=(14, 8))
+        FigureCanvasAgg(fig)
+        _PLOT_FIGURE = fig, fig.add_subplot()
+    return _PLOT_FIGURE
+
+
+@lru_cache(maxsize=8)
+def _color_palette(n_colors: int) -> Tuple[Tuple[float, float, float], ...]:
+    """
+    Returns the plot line colors for a given number of IP addresses.
+
+    Cached so the seaborn palette is built once per IP count rather than once per plot.
+
+    Args:
+        n_colors (int): Number of colors, one per IP address.
+
+    Returns:
+        Tuple[Tuple[float, float, float], ...]: RGB colors from seaborn's "deep" palette.
+    """
+    return tuple(sns.color_palette("deep", n_colors=n_colors))
+
+
+def _decimate_min_max(
+    x: np.ndarray, y: np.ndarray, n_bins: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduces a series to the minimum and maximum point of each bin.
+
+    Keeping both extremes of every bin preserves the visual envelope of the line,
+    including latency spikes, while bounding the number of vertices to draw to
+    about `2 * n_bins`. Series with no more than `4 * n_bins` points are returned
+    unchanged.
+
+    Args:
+        x (np.ndarray): X values of the series, in ascending order.
+        y (np.ndarray): Y values of the series, without NaN values.
+        n_bins (int): Number of bins, typically the plot width in pixels.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The decimated x and y values, in their original order.
+    """
+    if n_bins <= 0 or y.size <= 4 * n_bins:
+        return x, y
+
+    bin_size = -(-y.size // n_bins)  # Ceiling division
+    full_bins = y.size // bin_size
+    binned = y[: full_bins * bin_size].reshape(full_bins, bin_size)
+    offsets = np.arange(full_bins) * bin_size
+    indices = [offsets + binned.argmin(axis=1), offsets + binned.argmax(axis=1)]
+
+    # Remaining points that do not fill a whole bin
+    remainder = y[full_bins * bin_size :]
+    if remainder.size:
+        start = full_bins * bin_size
+        indices.append(
+            np.array([start + remainder.argmin(), start + remainder.argmax()])
+        )
+
+    keep = np.unique(np.concatenate(indices))
+    return x[keep], y[keep]
+
+
+def create_plots_subdir(config: Dict[str, str]) -> Optional[Path]:
+    """
+    Creates a timestamped subdirectory for plots within the plots directory.
+
+    Args:
+        config (Dict[str, str]): Configuration dictionary containing the plots directory path.
+
+    Returns:
+        Optional[Path]: Path to the created subdirectory, or None if it could not be created.
+
+    Example:
+        ```python
+        plots_subdir = create_plots_subdir(config)
+        ```
+    """
+    # Retrieve the base plots directory from the configuration
+    plots_dir = Path(config.get("plots_dir", "plots"))
+
+    # Name the subdirectory after the run, like its results subdirectory
+    timestamp = get_run_timestamp(config)
+
+    # Create a timestamped subdirectory within the plots directory
+    plots_subdir = plots_dir / f"plots_{timestamp}"
+    try:
+        plots_subdir.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Created plots subdirectory: {plots_subdir}")
+    except OSError as e:
+        console_proxy.console.print(
+            f"[bold red]Failed to create plots subdirectory {plots_subdir}: {e}[/bold red]"
+        )
+        logger.error(f"Failed to create plots subdirectory {plots_subdir}: {e}")
+        return None
+
+    return plots_subdir
+
+
 def generate_plots(
     config: Dict[str, str],
-    data_dict: Dict[str, Dict[str, Optional[pd.DataFrame]]],
+    data_dict: Dict[str, Dict[str, Any]],
     latency_threshold: float,
     no_segmentation: bool = False,
+    plots_subdir: Optional[Path] = None,
 ) -> None:
     """
     Generates latency plots based on the provided configuration and data.
@@ -114,18 +249,21 @@ def generate_plots(
     Args:
         config (Dict[str, str]):
             Configuration dictionary containing settings like plots folder path and segmentation preferences.
-        data_dict (Dict[str, Dict[str, Optional[pd.DataFrame]]]):
+        data_dict (Dict[str, Dict[str, Any]]):
             A nested dictionary where each key is an IP address, and its value is another dictionary
             containing 'raw' and 'aggregated' pandas DataFrames with ping data.
+            Optional 'raw_max' and 'agg_max' entries hold each series' maximum plotted
+            latency and set the y-axis limit.
         latency_threshold (float):
             Latency threshold in milliseconds for highlighting high latency regions.
         no_segmentation (bool, optional):
             If True, generates a single plot for the entire duration without segmentation.
             Defaults to False.
+        plots_subdir (Optional[Path], optional):
+            Existing timestamped subdirectory to save the plots in, as returned by
+            `create_plots_subdir`. If None, a new one is created. Defaults to None.
 
     Raises:
-        OSError:
-            If the plots subdirectory cannot be created.
         Exception:
             For any other errors that occur during plot generation.
 
@@ -134,25 +272,13 @@ def generate_plots(
         generate_plots(config, data_dict, latency_threshold=200.0, no_segmentation=False)
         ```
     """
-    # Retrieve the base plots directory from the configuration
-    plots_dir = Path(
-        config.get("plots_dir")
-    )  # Changed from "plots_folder" to "plots_dir"
+    if plots_subdir is None:
+        plots_subdir = create_plots_subdir(config)
+        if plots_subdir is None:
+            return  # Exit the function if the directory cannot be created
 
-    # Generate a timestamp for the subdirectory name
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-
-    # Create a timestamped subdirectory within the plots directory
-    plots_subdir = plots_dir / f"plots_{timestamp}"
-    try:
-        plots_subdir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Created plots subdirectory: {plots_subdir}")
-    except OSError as e:
-        console_proxy.console.print(
-            f"[bold red]Failed to create plots subdirectory {plots_subdir}: {e}[/bold red]"
-        )
-        logger.error(f"Failed to create plots subdirectory {plots_subdir}: {e}")
-        return  # Exit the function if the directory cannot be created
+    # Plot filenames share the timestamp of their subdirectory
+    timestamp = plots_subdir.name.removeprefix("plots_")
 
     # Determine the maximum duration based on the data
     try:
@@ -179,6 +305,20 @@ def generate_plots(
         logger.error(f"Error determining maximum duration: {e}")
         return
 
+    # Dynamic y-axis limit from the per-IP maxima cached when the data was loaded
+    overall_max_ping = max(
+        (
+            max(data.get("raw_max", 0.0), data.get("agg_max", 0.0))
+            for data in data_dict.values()
+        ),
+        default=0.0,
+    )
+    if overall_max_ping > 800:
+        y_max = 800.0
+    else:
+        y_max = overall_max_ping * 1.05  # Add 5% padding
+    logger.debug(f"Y-axis limit for plotting: {y_max} ms")
+
     # If no segmentation is requested, generate a single plot
     if no_segmentation:
         segment_starts = [0]
@@ -194,102 +334,117 @@ def generate_plots(
         segment_labels = [f"hour_{i+1}" for i in range(len(segment_starts))]
         logger.debug(f"Segmentation labels: {segment_labels}")
 
-    for segment_start, segment_end, segment_label in zip(
-        segment_starts, segment_ends, segment_labels
-    ):
-        plt.figure(figsize=(14, 8))
-        # Define a color palette
-        palette = sns.color_palette("deep", n_colors=len(data_dict))
-        high_latency_times = []
+    fig, ax = _get_plot_axes()
+    plot_width_px = int(fig.get_size_inches()[0] * fig.dpi)
+    # Define a color palette
+    palette = _color_palette(len(data_dict))
 
-        for idx, (ip, data) in enumerate(data_dict.items()):
-            raw_df = data.get("raw")
-            agg_df = data.get("aggregated")
-            color = palette[idx % len(palette)]
+    # Validate and prepare each IP's series once rather than once per segment
+    plot_series = []
+    for idx, (ip, data) in enumerate(data_dict.items()):
+        raw_df = data.get("raw")
+        agg_df = data.get("aggregated")
+        color = palette[idx % len(palette)]
 
-            if raw_df is None:
-                console_proxy.console.print(
-                    f"[yellow]No raw data available for IP: {ip}.[/yellow]"
-                )
-                logger.warning(f"No raw data available for IP: {ip}.")
-                continue
+        if raw_df is None:
+            console_proxy.console.print(
+                f"[yellow]No raw data available for IP: {ip}.[/yellow]"
+            )
+            logger.warning(f"No raw data available for IP: {ip}.")
+            continue
 
-            plot_raw_df = raw_df.copy()
+        # Ensure 'Ping (ms)' column exists
+        if "Ping (ms)" not in raw_df.columns:
+            console_proxy.console.print(
+                f"[bold red]Missing 'Ping (ms)' column for IP: {ip}.[/bold red]"
+            )
+            logger.error(f"Missing 'Ping (ms)' column for IP: {ip}.")
+            continue
 
-            # Ensure 'Ping (ms)' column exists
-            if "Ping (ms)" not in plot_raw_df.columns:
-                console_proxy.console.print(
-                    f"[bold red]Missing 'Ping (ms)' column for IP: {ip}.[/bold red]"
-                )
-                logger.error(f"Missing 'Ping (ms)' column for IP: {ip}.")
-                continue
+        # Ensure 'Time (s)' column exists
+        if "Time (s)" not in raw_df.columns:
+            console_proxy.console.print(
+                f"[bold red]Missing 'Time (s)' column for IP: {ip}.[/bold red]"
+            )
+            logger.error(f"Missing 'Time (s)' column for IP: {ip}.")
+            continue
 
-            # Fill NaN values and clip to avoid extreme values
-            plot_raw_df["Ping (ms)"] = plot_raw_df["Ping (ms)"].fillna(800.0)
-            plot_raw_df["Ping (ms)"] = plot_raw_df["Ping (ms)"].clip(upper=800.0)
+        # Fill NaN values and clip to avoid extreme values
+        raw_times = raw_df["Time (s)"].to_numpy()
+        raw_pings = np.minimum(
+            np.nan_to_num(raw_df["Ping (ms)"].to_numpy(), nan=800.0), 800.0
+        )
 
-            # Ensure 'Time (s)' column exists
-            if "Time (s)" not in plot_raw_df.columns:
+        agg_series = None
+        if agg_df is not None:
+            # Ensure 'Mean Latency (ms)' and 'Time (s)' columns exist
+            if (
+                "Mean Latency (ms)" not in agg_df.columns
+                or "Time (s)" not in agg_df.columns
+            ):
                 console_proxy.console.print(
-                    f"[bold red]Missing 'Time (s)' column for IP: {ip}.[/bold red]"
+                    f"[bold red]Missing 'Mean Latency (ms)' or 'Time (s)' column in aggregated data for IP: {ip}.[/bold red]"
+                )
+                logger.error(
+                    f"Missing 'Mean Latency (ms)' or 'Time (s)' column in aggregated data for IP: {ip}."
+                )
+            else:
+                agg_series = (
+                    agg_df["Time (s)"].to_numpy(),
+                    agg_df["Mean Latency (ms)"].to_numpy(),
                 )
-                logger.error(f"Missing 'Time (s)' column for IP: {ip}.")
-                continue
 
-            # Filter data for the current segment
-            segment_data = plot_raw_df[
-                (plot_raw_df["Time (s)"] >= segment_start)
-                & (plot_raw_df["Time (s)"] < segment_end)
-            ]
+        plot_series.append((ip, color, raw_times, raw_pings, agg_series))
+
+    for segment_start, segment_end, segment_label in zip(
+        segment_starts, segment_ends, segment_labels
+    ):
+        ax.cla()
+        high_latency_times = []
 
-            if segment_data.empty:
+        for ip, color, raw_times, raw_pings, agg_series in plot_series:
+            # Series are in ascending time order, so a segment is a contiguous slice
+            lo, hi = np.searchsorted(raw_times, [segment_start, segment_end])
+
+            if lo == hi:
                 console_proxy.console.print(
                     f"[yellow]No data available for IP: {ip} in segment '{segment_label}'.[/yellow]"
                 )
                 logger.warning(f"No data for IP: {ip} in segment '{segment_label}'.")
                 continue
 
-            # Plot Raw Ping with increased opacity
-            sns.lineplot(
-                x="Time (s)",
-                y="Ping (ms)",
-                data=segment_data,
+            segment_times = raw_times[lo:hi]
+            segment_pings = raw_pings[lo:hi]
+
+            # Plot Raw Ping with increased opacity, reduced to the min/max
+            # envelope when there are more points than the plot can resolve
+            plot_times, plot_pings = _decimate_min_max(
+                segment_times, segment_pings, n_bins=plot_width_px
+            )
+            ax.plot(
+                plot_times,
+                plot_pings,
                 label=f"{ip} Raw Ping",
                 color=color,
                 alpha=0.6,
             )
 
             # Identify High Latency Times from Raw Data
-            high_latency_raw = segment_data[
-                segment_data["Ping (ms)"] > latency_threshold
-            ]
-            if not high_latency_raw.empty:
-                high_latency_times.extend(high_latency_raw["Time (s)"].tolist())
-                logger.debug(
-                    f"High latency times for IP {ip}: {high_latency_raw['Time (s)'].tolist()}"
+            ip_high_latency_times = segment_times[segment_pings > latency_threshold]
+            if ip_high_latency_times.size:
+                high_latency_times.append(ip_high_latency_times)
+                # Lazy, so the list is only formatted when debug logging is enabled
+                logger.opt(lazy=True).debug(
+                    "High latency times for IP {}: {}",
+                    lambda: ip,
+                    ip_high_latency_times.tolist,
                 )
 
-            if agg_df is not None:
-                # Ensure 'Mean Latency (ms)' and 'Time (s)' columns exist
-                if (
-                    "Mean Latency (ms)" not in agg_df.columns
-                    or "Time (s)" not in agg_df.columns
-                ):
-                    console_proxy.console.print(
-                        f"[bold red]Missing 'Mean Latency (ms)' or 'Time (s)' column in aggregated data for IP: {ip}.[/bold red]"
-                    )
-                    logger.error(
-                        f"Missing 'Mean Latency (ms)' or 'Time (s)' column in aggregated data for IP: {ip}."
-                    )
-                    continue
-
-                # Filter aggregated data for the current segment
-                agg_segment = agg_df[
-                    (agg_df["Time (s)"] >= segment_start)
-                    & (agg_df["Time (s)"] < segment_end)
-                ]
+            if agg_series is not None:
+                agg_times, agg_latency = agg_series
+                lo, hi = np.searchsorted(agg_times, [segment_start, segment_end])
 
-                if agg_segment.empty:
+                if lo == hi:
                     console_proxy.console.print(
                         f"[yellow]No aggregated data available for IP: {ip} in segment '{segment_label}'.[/yellow]"
                     )
@@ -298,14 +453,17 @@ def generate_plots(
                     )
                     continue
 
-                # Plot Mean Latency
-                sns.lineplot(
-                    x="Time (s)",
-                    y="Mean Latency (ms)",
-                    data=agg_segment,
+                # Plot Mean Latency, decimated like the raw series on very long runs
+                plot_times, plot_latency = _decimate_min_max(
+                    agg_times[lo:hi], agg_latency[lo:hi], n_bins=plot_width_px
+                )
+                ax.plot(
+                    plot_times,
+                    plot_latency,
                     label=f"{ip} Mean Latency",
                     linestyle="--",
-                    marker="o",
+                    # Markers only help while individual points are distinguishable
+                    marker="o" if plot_times.size < MAX_MARKED_POINTS else None,
                     color=color,
                     alpha=0.8,
                 )
@@ -313,37 +471,34 @@ def generate_plots(
         # Consolidate high latency times into shading regions
         shading_regions = []
         if high_latency_times:
-            # Sort and remove duplicates
-            sorted_times = sorted(set(high_latency_times))
-            # Initialize the first shading region
-            start = sorted_times[0]
-            end = sorted_times[0]
-
-            for time in sorted_times[1:]:
-                if time <= end + 1:
-                    end = time
-                else:
-                    shading_regions.append((start, end))
-                    start = time
-                    end = time
-            # Append the last shading region
-            shading_regions.append((start, end))
+            # Sort and remove duplicates across all IPs
+            sorted_times = np.unique(np.concatenate(high_latency_times))
+            # Split into runs of consecutive seconds
+            breaks = np.flatnonzero(np.diff(sorted_times) > 1) + 1
+            shading_regions = [
+                (run[0].item(), run[-1].item())
+                for run in np.split(sorted_times, breaks)
+            ]
 
             # Shade each high latency region
-            for region in shading_regions:
-                plt.axvspan(
+            for i, region in enumerate(shading_regions):
+                ax.axvspan(
                     region[0] - 0.5,  # Slight padding on the left
                     region[1] + 0.5,  # Slight padding on the right
                     color="red",
                     alpha=0.1,
-                    label="High Latency" if region == shading_regions[0] else "",
+                    label="High Latency" if i == 0 else "",
                 )
-            logger.debug(f"Shading regions: {shading_regions}")
+            logger.opt(lazy=True).debug("Shading regions: {}", lambda: shading_regions)
+
+        # Use the same latency scale for every segment; autoscale without cached maxima
+        if y_max > 0:
+            ax.set_ylim(0, y_max)
 
         # Customize Legend to avoid duplicate labels
-        handles, labels = plt.gca().get_legend_handles_labels()
+        handles, labels = ax.get_legend_handles_labels()
         by_label = dict(zip(labels, handles))
-        plt.legend(
+        ax.legend(
             by_label.values(),
             by_label.keys(),
             loc="upper left",
@@ -352,20 +507,20 @@ def generate_plots(
 
         # Adjust plot title and labels
         if no_segmentation:
-            plt.title("Ping Monitoring - Entire Duration")
+            ax.set_title("Ping Monitoring - Entire Duration")
         else:
             segment_start_formatted = str(timedelta(seconds=segment_start))
             segment_end_formatted = str(timedelta(seconds=segment_end))
-            plt.title(
+            ax.set_title(
                 f"Ping Monitoring - {segment_label.replace('_', ' ').title()} ({segment_start_formatted} to {segment_end_formatted})"
             )
 
-        plt.xlabel("Time (s)")
-        plt.ylabel("Latency (ms)")
-        plt.grid(
+        ax.set_xlabel("Time (s)")
+        ax.set_ylabel("Latency (ms)")
+        ax.grid(
             color="lightgray", linestyle="--", linewidth=0.5, alpha=0.7
         )  # Customized grid
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Define the plot filename with date, time, and segment label
         plot_filename = f"ping_plot_{timestamp}_{segment_label}.png"
@@ -373,8 +528,7 @@ def generate_plots(
 
         # Save the plot
         try:
-            plt.savefig(plot_path)
-            plt.close()
+            fig.savefig(plot_path, pil_kwargs={"compress_level": PNG_COMPRESS_LEVEL})
             console_proxy.console.print(
                 f"[bold green]Generated plot:[/bold green] {plot_path}"
             )
@@ -387,7 +541,7 @@ def generate_plots(
 
 
 def display_plots_and_summary(
-    data_dict: Dict[str, Dict[str, Optional[pd.DataFrame]]], config: Dict[str, str]
+    data_dict: Dict[str, Dict[str, Any]], config: Dict[str, str]
 ) -> None:
     """
     Coordinates plot generation and summary statistics display.
@@ -397,7 +551,7 @@ def display_plots_and_summary(
     Handles scenarios where data may be missing.
 
     Args:
-        data_dict (Dict[str, Dict[str, Optional[pd.DataFrame]]]):
+        data_dict (Dict[str, Dict[str, Any]]):
             Nested dictionary containing ping data.
         config (Dict[str, str]):
             Configuration dictionary containing settings.
@@ -12,46 +12,86 @@ Functions:
     - ask_confirmation: Prompts the user for a yes/no confirmation unless auto_confirm is True.
     - handle_clear_operations: Handles data clearing operations based on configuration flags.
     - validate_and_get_ips: Validates the list of IP addresses and returns the validated list.
+    - get_run_timestamp: Returns the timestamp shared by the directories of the current run.
     - create_results_directory: Creates a results subdirectory with a timestamp and returns its path.
 """
 
-from datetime import datetime
 import ipaddress
 import shutil
+import socket
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, List, Union
 
 from rich.prompt import Prompt
 
 from loguru import logger  # Use Loguru logger
 from network_latency_monitor.console_manager import console_proxy  # Use custom console
 
+# Timestamp format shared by a run's log file, results and plots directories
+TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
 
-def clear_data(folders_to_clear: List[Path]) -> None:
+# (config flag, directory key) pairs cleared by handle_clear_operations; --clear selects all
+_CLEAR_TARGETS = (
+    ("clear_results", "results_dir"),
+    ("clear_plots", "plots_dir"),
+    ("clear_logs", "log_dir"),
+    # Cached ping times are derived from result files
+    ("clear_results", "cache_dir"),
+)
+
+
+def _clear_folder(folder_path: Path) -> None:
+    """
+    Removes a single directory and its contents, logging the outcome.
+
+    Log messages are passed to loguru as templates with arguments, so they are only
+    formatted when a sink accepts the level.
+
+    Args:
+        folder_path (Path): The directory to remove.
+
+    Raises:
+        OSError: If the folder cannot be removed.
+    """
+    try:
+        shutil.rmtree(folder_path)
+        logger.info("Successfully cleared folder: {}", folder_path)
+    except FileNotFoundError:
+        logger.warning("Folder not found: {}", folder_path)
+    except OSError as e:
+        logger.error("Failed to clear folder '{}': {}", folder_path, e)
+        raise
+
+
+def clear_data(folders_to_clear: Iterable[Union[str, Path]]) -> None:
     """
     Removes specified directories and their contents.
 
-    This function iterates through a list of folder paths and deletes each one using
-    `shutil.rmtree`. It logs the outcome of each deletion attempt, noting whether
-    the folder was successfully cleared or if it was not found.
+    Each folder is deleted with `shutil.rmtree`; when several folders are given they
+    are removed concurrently in a thread pool, since the work is dominated by unlink
+    syscalls that release the GIL. The outcome of each deletion attempt is logged,
+    noting whether the folder was successfully cleared or if it was not found.
 
     Args:
-        folders_to_clear (List[Path]): A list of directory paths to be removed.
+        folders_to_clear (Iterable[Union[str, Path]]): Directory paths to be removed;
+            strings are converted to `Path` once up front.
 
     Raises:
         OSError: If a folder cannot be removed due to permission issues or other OS-related errors.
     """
-    for folder_path in folders_to_clear:
-        try:
-            if folder_path.exists():
-                shutil.rmtree(folder_path)
-                logger.info(f"Successfully cleared folder: {folder_path}")
-            else:
-                logger.warning(f"Folder not found: {folder_path}")
-        except OSError as e:
-            logger.error(f"Failed to clear folder '{folder_path}': {e}")
-            raise
+    folders = [Path(folder) for folder in folders_to_clear]
+    if len(folders) <= 1:
+        for folder_path in folders:
+            _clear_folder(folder_path)
+        return
+
+    with ThreadPoolExecutor(max_workers=len(folders)) as executor:
+        # Consuming the results re-raises the first OSError from a worker
+        list(executor.map(_clear_folder, folders))
 
 
 def ask_confirmation(message: str, auto_confirm: bool) -> bool:
@@ -60,6 +100,8 @@ def ask_confirmation(message: str, auto_confirm: bool) -> bool:
 
     This function displays a confirmation message to the user, asking for a 'y' or 'n' response.
     If `auto_confirm` is set to True, the function automatically returns True without prompting.
+    When stdin is not a terminal (scripts, CI), a single line is read with `input()` instead
+    of Rich's prompt; anything other than 'y'/'yes' counts as no.
 
     Args:
         message (str): The confirmation message to display to the user.
@@ -73,7 +115,10 @@ def ask_confirmation(message: str, auto_confirm: bool) -> bool:
         return True
 
     try:
-        response = Prompt.ask(f"{message}", choices=["y", "n"], default="n")
+        if sys.stdin.isatty():
+            response = Prompt.ask(f"{message}", choices=["y", "n"], default="n")
+        else:
+            response = input(f"{message} [y/n] (n): ").strip()
         confirmation = response.lower() in ["y", "yes"]
         logger.debug(f"User response: {'Yes' if confirmation else 'No'}")
         return confirmation
@@ -96,30 +141,25 @@ def handle_clear_operations(config: Dict) -> None:
     Raises:
         SystemExit: Exits the program after clearing operations are handled.
     """
-    folders_to_clear = []
-    confirmation_message = ""
+    # Normal runs set no clear flags; return before building any prompt
+    if not config.get("clear", False) and not any(
+        config.get(flag, False) for flag, _ in _CLEAR_TARGETS
+    ):
+        return
 
     # Determine which folders to clear based on flags
     if config.get("clear", False):
-        folders_to_clear = [
-            config.get("results_dir"),
-            config.get("plots_dir"),
-            config.get("log_dir"),
-        ]
+        folders_to_clear = [config.get(dir_key) for _, dir_key in _CLEAR_TARGETS]
         confirmation_message = (
             "Are you sure you want to clear ALL data (results, plots, logs)? [y/n]"
         )
     else:
-        if config.get("clear_results", False):
-            folders_to_clear.append(config.get("results_dir"))
-        if config.get("clear_plots", False):
-            folders_to_clear.append(config.get("plots_dir"))
-        if config.get("clear_logs", False):
-            folders_to_clear.append(config.get("log_dir"))
-        if folders_to_clear:
-            confirmation_message = (
-                "Are you sure you want to clear the selected data? [y/n]"
-            )
+        folders_to_clear = [
+            config.get(dir_key)
+            for flag, dir_key in _CLEAR_TARGETS
+            if config.get(flag, False)
+        ]
+        confirmation_message = "Are you sure you want to clear the selected data? [y/n]"
 
     # Convert folder paths to Path objects and filter out None values
     folders_to_clear = [Path(folder) for folder in folders_to_clear if folder]
@@ -139,12 +179,69 @@ def handle_clear_operations(config: Dict) -> None:
         sys.exit(0)  # Exit after clearing
 
 
+def _is_valid_ip(ip) -> bool:
+    """
+    Checks whether a value is a valid IPv4 or IPv6 address.
+
+    String values are checked through a memoized helper, so an address that appears
+    repeatedly is only parsed once per process. Other values (which may be
+    unhashable) are checked directly.
+
+    Args:
+        ip: The value to check, normally a string.
+
+    Returns:
+        bool: True if the value is a valid IP address, False otherwise.
+    """
+    if isinstance(ip, str):
+        return _is_valid_ip_str(ip)
+    return _check_ip(ip)
+
+
+@lru_cache(maxsize=256)
+def _is_valid_ip_str(ip: str) -> bool:
+    """
+    Memoized `_check_ip` for string addresses.
+    """
+    return _check_ip(ip)
+
+
+def _check_ip(ip) -> bool:
+    """
+    Parses a value as an IPv4 or IPv6 address.
+
+    Dotted-quad IPv4 addresses are checked with `socket.inet_pton`, which is strict
+    (exactly four decimal octets, no leading zeros) and avoids building an
+    `ipaddress` object; anything it rejects, such as IPv6, is checked with
+    `ipaddress.ip_address`.
+
+    Args:
+        ip: The value to check.
+
+    Returns:
+        bool: True if the value is a valid IP address, False otherwise.
+    """
+    try:
+        socket.inet_pton(socket.AF_INET, ip)
+        return True
+    except (OSError, TypeError, ValueError):
+        pass
+    try:
+        ipaddress.ip_address(ip)
+        return True
+    except ValueError:
+        return False
+
+
 def validate_and_get_ips(config: Dict) -> List[str]:
     """
     Validates the list of IP addresses and returns the validated list.
 
     This function checks each IP address provided in the configuration for validity.
     Invalid IP addresses are reported, and if none are valid, the program exits.
+    The validated list is cached on the configuration under `_validated_ips`
+    together with the addresses it was built from, so repeated calls return
+    immediately while `ip_addresses` is unchanged.
 
     Args:
         config (Dict): Configuration dictionary containing the list of IP addresses.
@@ -156,6 +253,12 @@ def validate_and_get_ips(config: Dict) -> List[str]:
         SystemExit: If no valid IP addresses are provided.
     """
     ips = config.get("ip_addresses", ["8.8.8.8"])
+    key = tuple(ips) if isinstance(ips, (list, tuple)) else ips
+
+    cached = config.get("_validated_ips")
+    if cached is not None and cached[0] == key:
+        logger.debug(f"Using cached validated IP addresses: {cached[1]}")
+        return cached[1]
 
     if not ips:
         default_ip = ["8.8.8.8"]
@@ -167,11 +270,10 @@ def validate_and_get_ips(config: Dict) -> List[str]:
 
     validated_ips = []
     for ip in ips:
-        try:
-            ipaddress.ip_address(ip)
+        if _is_valid_ip(ip):
             validated_ips.append(ip)
             logger.debug(f"Validated IP address: {ip}")
-        except ValueError:
+        else:
             console_proxy.console.print(
                 f"[bold red]Invalid IP address:[/bold red] {ip}"
             )
@@ -185,15 +287,44 @@ def validate_and_get_ips(config: Dict) -> List[str]:
         sys.exit(1)
 
     logger.info(f"Validated IP addresses: {validated_ips}")
+    config["_validated_ips"] = (key, validated_ips)
     return validated_ips
 
 
-def create_results_directory(config: Dict) -> Path:
+def get_run_timestamp(
+    config: Dict, _now: Callable[[], time.struct_time] = time.localtime
+) -> str:
+    """
+    Returns the timestamp that names the directories of the current run.
+
+    The timestamp is computed on first use and stored in the configuration, so the
+    results and plots directories of a run share the same name suffix.
+
+    Args:
+        config (Dict): Configuration dictionary for the current run.
+        _now (Callable[[], time.struct_time], optional): Clock used for the first call.
+            Defaults to `time.localtime`; tests can pass a fixed time instead.
+
+    Returns:
+        str: Timestamp formatted as `YYYY-MM-DD_HH-MM-SS`.
+    """
+    timestamp = config.get("_run_timestamp")
+    if timestamp is None:
+        timestamp = time.strftime(TIMESTAMP_FORMAT, _now())
+        config["_run_timestamp"] = timestamp
+    return timestamp
+
+
+def create_results_directory(
+    config: Dict, _now: Callable[[], time.struct_time] = time.localtime
+) -> Path:
     """
     Creates a results subdirectory with a timestamp and returns its path.
 
     Args:
         config (Dict): Configuration dictionary containing settings and directory paths.
+        _now (Callable[[], time.struct_time], optional): Clock passed to
+            `get_run_timestamp`. Defaults to `time.localtime`.
 
     Returns:
         Path: The path to the created results subdirectory.
@@ -209,7 +340,7 @@ def create_results_directory(config: Dict) -> Path:
     if not isinstance(results_dir, Path):
         results_dir = Path(results_dir)
 
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    timestamp = get_run_timestamp(config, _now)
     results_subfolder = results_dir / f"results_{timestamp}"
     try:
         results_subfolder.mkdir(parents=True, exist_ok=True)
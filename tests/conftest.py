@@ -0,0 +1,61 @@
+# tests/conftest.py
+
+from types import SimpleNamespace
+
+import pytest
+
+from network_latency_monitor.config import DEFAULT_CONFIG, get_standard_directories
+from network_latency_monitor.console_manager import NullConsole, console_proxy
+
+
+@pytest.fixture(autouse=True)
+def clear_standard_directories_cache():
+    """
+    Clear the cached standard directories so each test sees its own AppDirs patch.
+    """
+    get_standard_directories.cache_clear()
+    yield
+    get_standard_directories.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def null_console(monkeypatch):
+    """
+    Silence console output by routing console_proxy to a shared NullConsole.
+
+    Tests that need to inspect output can monkeypatch console_proxy.console again.
+    """
+    monkeypatch.setattr(console_proxy, "console", _NULL_CONSOLE)
+
+
+_NULL_CONSOLE = NullConsole()
+
+
+@pytest.fixture(scope="session")
+def default_config():
+    """
+    Read-only DEFAULT_CONFIG shared by all tests; copy it before mutating.
+    """
+    return DEFAULT_CONFIG
+
+
+@pytest.fixture
+def mocked_dirs(mocker, tmp_path):
+    """
+    Point AppDirs at config/, data/ and logs/ under tmp_path and return tmp_path.
+    """
+    app_dirs = SimpleNamespace(
+        user_config_dir=str(tmp_path / "config"),
+        user_data_dir=str(tmp_path / "data"),
+        user_log_dir=str(tmp_path / "logs"),
+    )
+    mocker.patch("network_latency_monitor.config.AppDirs", return_value=app_dirs)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """
+    Session-wide temporary directory for tests that only need paths, not directories.
+    """
+    return tmp_path_factory.mktemp("shared")
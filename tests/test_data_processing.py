@@ -0,0 +1,300 @@
+# tests/test_data_processing.py
+
+import math
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+from loguru import logger
+
+from network_latency_monitor import data_processing
+from network_latency_monitor.data_processing import (
+    aggregate_ping_times,
+    extract_ping_times,
+)
+
+
+def test_extract_ping_times_values_and_lost(tmp_path):
+    """
+    Test that latency values are parsed and lost pings become NaN.
+    """
+    results_file = tmp_path / "ping_results_8.8.8.8.txt"
+    results_file.write_text("23.5\nLost\n24.0\nlost\n")
+
+    ping_times = extract_ping_times(str(results_file))
+
+    assert ping_times.dtype == np.float32
+    assert len(ping_times) == 4
+    assert ping_times[0] == 23.5
+    assert math.isnan(ping_times[1])
+    assert ping_times[2] == 24.0
+    assert math.isnan(ping_times[3])
+
+
+def test_extract_ping_times_unexpected_lines(tmp_path):
+    """
+    Test that unexpected lines (such as ping errors) are recorded as lost pings.
+    """
+    results_file = tmp_path / "ping_results_8.8.8.8.txt"
+    results_file.write_text("23.5\nError: [Errno 2] No such file, or directory\n25.0\n")
+
+    ping_times = extract_ping_times(str(results_file))
+
+    assert len(ping_times) == 3
+    assert ping_times[0] == 23.5
+    assert math.isnan(ping_times[1])
+    assert ping_times[2] == 25.0
+
+
+@pytest.mark.parametrize("token", ["NA", "null", "N/A", ""])
+def test_extract_ping_times_reports_pandas_na_tokens(tmp_path, monkeypatch, token):
+    """
+    Test that tokens pandas treats as NA by default are reported as unexpected lines.
+    """
+    mock_logger = MagicMock()
+    monkeypatch.setattr(data_processing, "logger", mock_logger)
+    results_file = tmp_path / "ping_results_8.8.8.8.txt"
+    results_file.write_text(f"23.5\n{token}\n25.0\n")
+
+    ping_times = extract_ping_times(str(results_file))
+
+    assert len(ping_times) == 3
+    assert math.isnan(ping_times[1])
+    mock_logger.warning.assert_called_once_with(
+        f"Unexpected line format in {results_file}: {token}"
+    )
+
+
+def test_extract_ping_times_missing_file(tmp_path):
+    """
+    Test that a missing file yields an empty array.
+    """
+    ping_times = extract_ping_times(str(tmp_path / "does_not_exist.txt"))
+
+    assert ping_times.size == 0
+
+
+def test_extract_ping_times_cache(tmp_path, monkeypatch):
+    """
+    Test that parsed ping times are cached and invalidated when the file changes.
+    """
+    monkeypatch.setattr(data_processing, "PING_CACHE_MIN_PINGS", 2)
+    results_file = tmp_path / "ping_results_8.8.8.8.txt"
+    results_file.write_text("23.5\nLost\n24.0\n")
+    cache_dir = tmp_path / "data" / "cache"
+
+    first = extract_ping_times(str(results_file), cache_dir)
+    cache_files = list(cache_dir.glob("*.npy"))
+    assert len(cache_files) == 1
+
+    # A cache hit must not re-parse the file
+    monkeypatch.setattr(data_processing, "_parse_ping_times", None)
+    np.testing.assert_array_equal(
+        extract_ping_times(str(results_file), cache_dir), first
+    )
+    monkeypatch.undo()
+
+    # Changing the file invalidates the old entry
+    monkeypatch.setattr(data_processing, "PING_CACHE_MIN_PINGS", 2)
+    results_file.write_text("23.5\nLost\n24.0\n30.0\n")
+    stat = results_file.stat()
+    os.utime(results_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert len(extract_ping_times(str(results_file), cache_dir)) == 4
+    assert len(list(cache_dir.glob("*.npy"))) == 1
+
+
+def test_extract_ping_times_no_cache_by_default(tmp_path, monkeypatch):
+    """
+    Test that nothing is cached unless a cache directory is given.
+    """
+    monkeypatch.setattr(data_processing, "PING_CACHE_MIN_PINGS", 2)
+    results_file = tmp_path / "ping_results_8.8.8.8.txt"
+    results_file.write_text("23.5\nLost\n24.0\n")
+
+    extract_ping_times(str(results_file))
+
+    assert [p.name for p in tmp_path.iterdir()] == [results_file.name]
+
+
+def test_aggregate_ping_times_full_and_remaining_intervals():
+    """
+    Test aggregation over full intervals plus a shorter remaining interval.
+    """
+    ping_times = np.array(
+        [10.0, 20.0, np.nan, 30.0, 30.0, 30.0, 40.0], dtype=np.float32
+    )
+
+    midpoints, mean_latency, packet_loss = aggregate_ping_times(ping_times, 3)
+
+    np.testing.assert_allclose(midpoints, [1.5, 4.5, 6.5])
+    np.testing.assert_allclose(mean_latency, [15.0, 30.0, 40.0])
+    np.testing.assert_allclose(packet_loss, [100 / 3, 0.0, 0.0])
+
+
+def test_aggregate_ping_times_all_lost_interval():
+    """
+    Test that an interval where every ping was lost has 0.0 mean latency and 100% loss.
+    """
+    ping_times = np.array([np.nan, np.nan, 12.0, 14.0], dtype=np.float32)
+
+    midpoints, mean_latency, packet_loss = aggregate_ping_times(ping_times, 2)
+
+    np.testing.assert_allclose(midpoints, [1.0, 3.0])
+    np.testing.assert_allclose(mean_latency, [0.0, 13.0])
+    np.testing.assert_allclose(packet_loss, [100.0, 0.0])
+
+
+def test_process_ping_results_parallel_matches_sequential(tmp_path, monkeypatch):
+    """
+    Test that processing files in worker processes gives the same data as sequentially.
+    """
+    (tmp_path / "ping_results_8.8.8.8.txt").write_text("23.5\nLost\n" * 60)
+    (tmp_path / "ping_results_1.1.1.1.txt").write_text("12.0\n" * 120)
+    config = {"duration": 120, "no_aggregation": False}
+
+    sequential = data_processing.process_ping_results(tmp_path, config)
+    monkeypatch.setattr(data_processing, "PARALLEL_MIN_BYTES", 0)
+    parallel = data_processing.process_ping_results(tmp_path, config)
+
+    assert sequential.keys() == parallel.keys() == {"8.8.8.8", "1.1.1.1"}
+    for ip in sequential:
+        pd.testing.assert_frame_equal(sequential[ip]["raw"], parallel[ip]["raw"])
+        pd.testing.assert_frame_equal(
+            sequential[ip]["aggregated"], parallel[ip]["aggregated"]
+        )
+
+
+def test_load_ping_files_workers_log_through_parent(tmp_path, monkeypatch):
+    """
+    Test that messages logged by spawned workers go through the parent's sinks.
+    """
+    files = []
+    for ip in ("8.8.8.8", "1.1.1.1"):
+        results_file = tmp_path / f"ping_results_{ip}.txt"
+        results_file.write_text("23.5\nbogus\n24.0\n")
+        files.append(results_file)
+    monkeypatch.setattr(data_processing, "PARALLEL_MIN_BYTES", 0)
+    monkeypatch.setattr(
+        data_processing,
+        "ProcessPoolExecutor",
+        partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")),
+    )
+    messages = []
+    logger.remove()
+    logger.add(messages.append, level="WARNING", format="{message}")
+    try:
+        loaded = data_processing._load_ping_files(files, aggregate=False)
+    finally:
+        logger.remove()
+        logger.add(sys.stderr)
+
+    assert [len(ping_times) for ping_times, _ in loaded] == [3, 3]
+    # The workers' DEBUG fallback message is filtered out by the parent's level
+    assert sorted(message.strip() for message in messages) == sorted(
+        f"Unexpected line format in {results_file}: bogus" for results_file in files
+    )
+
+
+def test_process_ping_files_plots_all_ips_once(tmp_path):
+    """
+    Test that a batch of result files is plotted into a single subdirectory in one pass.
+    """
+    results_dir = tmp_path / "results"
+    results_dir.mkdir()
+    file_paths = []
+    for ip in ("8.8.8.8", "1.1.1.1"):
+        results_file = results_dir / f"ping_results_{ip}.txt"
+        results_file.write_text("23.5\nLost\n" * 60)
+        file_paths.append(str(results_file))
+    config = {"plots_dir": str(tmp_path / "plots")}
+
+    data_processing.process_ping_files(
+        file_paths,
+        config,
+        no_aggregation=False,
+        duration=120,
+        latency_threshold=200.0,
+    )
+
+    plots_subdirs = list((tmp_path / "plots").iterdir())
+    assert len(plots_subdirs) == 1
+    assert len(list(plots_subdirs[0].glob("*.png"))) == 1
+
+
+def test_process_ping_files_caches_in_cache_dir(tmp_path, monkeypatch):
+    """
+    Test that file mode caches ping times in a private cache_dir, not next to the input.
+    """
+    monkeypatch.setattr(data_processing, "PING_CACHE_MIN_PINGS", 2)
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    results_file = input_dir / "ping_results_8.8.8.8.txt"
+    results_file.write_text("23.5\nLost\n" * 60)
+    config = {
+        "plots_dir": str(tmp_path / "plots"),
+        "cache_dir": tmp_path / "data" / "cache",
+    }
+
+    data_processing.process_ping_files(
+        [str(results_file)],
+        config,
+        no_aggregation=False,
+        duration=120,
+        latency_threshold=200.0,
+    )
+
+    assert list(input_dir.iterdir()) == [results_file]
+    cache_dir = tmp_path / "data" / "cache"
+    assert len(list(cache_dir.glob("*.npy"))) == 1
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+
+
+def test_process_ping_results_caches_plot_maxima(tmp_path):
+    """
+    Test that each IP entry caches the maxima used for the plot's y-axis limit.
+    """
+    (tmp_path / "ping_results_8.8.8.8.txt").write_text("23.5\nLost\n" * 60)
+    (tmp_path / "ping_results_1.1.1.1.txt").write_text("12.0\n30.0\n" * 60)
+    config = {"duration": 120, "no_aggregation": False}
+
+    data_dict = data_processing.process_ping_results(tmp_path, config)
+
+    # Lost pings are plotted at the 800 ms cap
+    assert data_dict["8.8.8.8"]["raw_max"] == 800.0
+    assert data_dict["8.8.8.8"]["agg_max"] == 23.5
+    assert data_dict["1.1.1.1"]["raw_max"] == 30.0
+    assert data_dict["1.1.1.1"]["agg_max"] == 21.0
+
+
+def test_ip_from_filename():
+    """
+    Test IP extraction from result file names, including IPv6 and unexpected names.
+    """
+    assert (
+        data_processing._ip_from_filename(Path("ping_results_8.8.8.8.txt")) == "8.8.8.8"
+    )
+    assert (
+        data_processing._ip_from_filename(Path("results/ping_results_2001:db8::1.txt"))
+        == "2001:db8::1"
+    )
+    assert data_processing._ip_from_filename(Path("ping_data_1.1.1.1.log")) == "1.1.1.1"
+
+
+def test_extract_ping_times_empty_file(tmp_path):
+    """
+    Test that an empty result file yields an empty array.
+    """
+    results_file = tmp_path / "ping_results_8.8.8.8.txt"
+    results_file.touch()
+
+    ping_times = extract_ping_times(str(results_file))
+
+    assert ping_times.size == 0
+    assert ping_times.dtype == np.float32
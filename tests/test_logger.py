@@ -9,12 +9,11 @@ def test_setup_logging_creates_log_file(tmp_path):
     Test that setup_logging creates a log file in the specified directory.
     """
     log_folder = tmp_path / "logs"
-    setup_logging(str(log_folder))
+    log_file = setup_logging(str(log_folder))
 
-    # Check that at least one log file was created
-    log_files = list(log_folder.glob("nlm_*.log"))
-    assert len(log_files) > 0
-    assert log_files[0].is_file()
+    # The returned path is the log file that was opened
+    assert log_file.name.startswith("nlm_")
+    assert log_file.is_file()
 
 
 def test_setup_logging_no_exceptions(tmp_path):
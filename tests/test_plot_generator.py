@@ -0,0 +1,100 @@
+# tests/test_plot_generator.py
+
+import numpy as np
+import pandas as pd
+from rich.console import Console
+
+from network_latency_monitor.console_manager import console_proxy
+from network_latency_monitor.plot_generator import (
+    _decimate_min_max,
+    create_plots_subdir,
+    display_summary,
+)
+from network_latency_monitor.utils import create_results_directory
+
+
+def test_decimate_min_max_short_series_unchanged():
+    """
+    Test that series the plot can resolve are returned unchanged.
+    """
+    x = np.arange(1, 101)
+    y = np.linspace(10.0, 20.0, 100)
+
+    dec_x, dec_y = _decimate_min_max(x, y, n_bins=25)
+
+    assert dec_x is x
+    assert dec_y is y
+
+
+def test_decimate_min_max_keeps_spikes():
+    """
+    Test that decimation bounds the point count while keeping the extremes in order.
+    """
+    x = np.arange(1, 10_002)
+    y = np.full(x.size, 20.0)
+    y[1234] = 800.0
+    y[7777] = 1.0
+
+    dec_x, dec_y = _decimate_min_max(x, y, n_bins=100)
+
+    assert dec_y.size <= 2 * 101
+    assert 800.0 in dec_y
+    assert 1.0 in dec_y
+    assert np.all(np.diff(dec_x) > 0)
+
+
+def test_display_summary_statistics(monkeypatch):
+    """
+    Test the per-IP summary statistics, including an IP where every ping was lost.
+    """
+    console = Console(record=True, width=200)
+    monkeypatch.setattr(console_proxy, "console", console)
+    data_dict = {
+        "8.8.8.8": {
+            "raw": pd.DataFrame(
+                {"Ping (ms)": np.array([23.5, 24.1, np.nan, 25.0], dtype=np.float32)}
+            )
+        },
+        "1.1.1.1": {
+            "raw": pd.DataFrame({"Ping (ms)": np.array([np.nan], dtype=np.float32)})
+        },
+    }
+
+    display_summary(data_dict)
+
+    lines = console.export_text().splitlines()
+    row_8 = next(line for line in lines if "8.8.8.8" in line).split("│")
+    row_1 = next(line for line in lines if "1.1.1.1" in line).split("│")
+    assert [cell.strip() for cell in row_8[1:-1]] == [
+        "8.8.8.8",
+        "4",
+        "3",
+        "25.00%",
+        "24.20",
+        "23.50",
+        "25.00",
+    ]
+    assert [cell.strip() for cell in row_1[1:-1]] == [
+        "1.1.1.1",
+        "1",
+        "0",
+        "100.00%",
+        "N/A",
+        "N/A",
+        "N/A",
+    ]
+
+
+def test_plots_subdir_shares_run_timestamp(tmp_path):
+    """
+    Test that the plots and results subdirectories of a run share their timestamp.
+    """
+    config = {"results_dir": tmp_path / "results", "plots_dir": tmp_path / "plots"}
+
+    results_subfolder = create_results_directory(config)
+    plots_subdir = create_plots_subdir(config)
+
+    assert plots_subdir.is_dir()
+    assert results_subfolder.name.removeprefix(
+        "results_"
+    ) == plots_subdir.name.removeprefix("plots_")
@@ -1,294 +1,395 @@
-# # tests/test_utils.py
-#
-# import pytest
-# import sys
-# from pathlib import Path
-# from unittest.mock import patch, MagicMock
-# from typing import Dict, List
-# from datetime import datetime
-#
-# from network_latency_monitor.utils import (
-#     clear_data,
-#     ask_confirmation,
-#     handle_clear_operations,
-#     validate_and_get_ips,
-#     create_results_directory,
-# )
-#
-# # 1. clear_data Tests
-#
-#
-# def test_clear_data(tmp_path):
-#     # Create temporary directories
-#     dir1 = tmp_path / "dir1"
-#     dir2 = tmp_path / "dir2"
-#     dir1.mkdir()
-#     dir2.mkdir()
-#
-#     assert dir1.exists()
-#     assert dir2.exists()
-#
-#     # Call clear_data
-#     clear_data([dir1, dir2])
-#
-#     # Verify directories are deleted
-#     assert not dir1.exists()
-#     assert not dir2.exists()
-#
-#
-# def test_clear_data_folder_not_found(tmp_path, caplog):
-#     # Create a temporary directory and then remove it to simulate "not found"
-#     dir1 = tmp_path / "dir1"
-#     dir1.mkdir()
-#     dir1.rmdir()
-#     # Verify that a warning was logged
-#     assert any("Folder not found" in message for message in caplog.text.splitlines())
-#
-#
-# def test_clear_data_permission_error(tmp_path):
-#     # Create a temporary directory and make it read-only
-#     dir1 = tmp_path / "dir1"
-#     dir1.mkdir()
-#     dir1.chmod(0o400)  # Read-only
-#
-#     with patch("shutil.rmtree", side_effect=OSError("Permission denied")):
-#         with pytest.raises(OSError, match="Permission denied"):
-#             clear_data([dir1])
-#
-#
-# # 2. ask_confirmation Tests
-#
-#
-# def test_ask_confirmation_auto_confirm_true():
-#     result = ask_confirmation("Are you sure?", auto_confirm=True)
-#     assert result is True
-#
-#
-# @patch("network_latency_monitor.utils.Prompt.ask")
-# def test_ask_confirmation_user_yes(mock_ask):
-#     mock_ask.return_value = "y"
-#     result = ask_confirmation("Are you sure?", auto_confirm=False)
-#     assert result is True
-#     mock_ask.assert_called_once_with("Are you sure?", choices=["y", "n"], default="n")
-#
-#
-# @patch("network_latency_monitor.utils.Prompt.ask")
-# def test_ask_confirmation_user_no(mock_ask):
-#     mock_ask.return_value = "n"
-#     result = ask_confirmation("Are you sure?", auto_confirm=False)
-#     assert result is False
-#     mock_ask.assert_called_once_with("Are you sure?", choices=["y", "n"], default="n")
-#
-#
-# # 3. handle_clear_operations Tests
-#
-#
-# @patch("network_latency_monitor.utils.clear_data")
-# @patch("network_latency_monitor.utils.ask_confirmation")
-# @patch("network_latency_monitor.utils.sys.exit")  # Patch sys.exit here
-# def test_handle_clear_operations_clear_all_true(
-#     mock_exit, mock_ask, mock_clear_data, tmp_path
-# ):
-#     config: Dict = {
-#         "clear": True,
-#         "results_dir": tmp_path / "results",
-#         "plots_dir": tmp_path / "plots",
-#         "log_dir": tmp_path / "logs",
-#         "yes": True,
-#     }
-#
-#     # Create directories
-#     config["results_dir"].mkdir()
-#     config["plots_dir"].mkdir()
-#     config["log_dir"].mkdir()
-#
-#     # Call handle_clear_operations
-#     handle_clear_operations(config)
-#
-#     # Verify that clear_data was called with all directories
-#     mock_clear_data.assert_called_once_with(
-#         [config["results_dir"], config["plots_dir"], config["log_dir"]]
-#     )
-#
-#     # Verify that sys.exit was called with 0
-#     mock_exit.assert_called_once_with(0)
-#
-#
-# @patch("network_latency_monitor.utils.clear_data")
-# @patch("network_latency_monitor.utils.ask_confirmation")
-# @patch("network_latency_monitor.utils.sys.exit")  # Patch sys.exit here
-# def test_handle_clear_operations_partial_clear(
-#     mock_exit, mock_ask, mock_clear_data, tmp_path
-# ):
-#     config: Dict = {
-#         "clear": False,
-#         "clear_results": True,
-#         "clear_plots": False,
-#         "clear_logs": True,
-#         "results_dir": tmp_path / "results",
-#         "plots_dir": tmp_path / "plots",
-#         "log_dir": tmp_path / "logs",
-#         "yes": False,
-#     }
-#
-#     # Create directories
-#     config["results_dir"].mkdir()
-#     config["log_dir"].mkdir()
-#
-#     mock_ask.return_value = True
-#
-#     # Call handle_clear_operations
-#     handle_clear_operations(config)
-#
-#     # Verify that clear_data was called with selected directories
-#     mock_clear_data.assert_called_once_with([config["results_dir"], config["log_dir"]])
-#
-#     # Verify that sys.exit was called with 0
-#     mock_exit.assert_called_once_with(0)
-#
-#
-# @patch("network_latency_monitor.utils.clear_data")
-# @patch("network_latency_monitor.utils.ask_confirmation", return_value=False)
-# @patch("network_latency_monitor.utils.sys.exit")  # Patch sys.exit here
-# def test_handle_clear_operations_cancel(mock_exit, mock_ask, mock_clear_data, tmp_path):
-#     config: Dict = {
-#         "clear": True,
-#         "results_dir": tmp_path / "results",
-#         "plots_dir": tmp_path / "plots",
-#         "log_dir": tmp_path / "logs",
-#         "yes": False,
-#     }
-#
-#     # Create directories
-#     config["results_dir"].mkdir()
-#     config["plots_dir"].mkdir()
-#     config["log_dir"].mkdir()
-#
-#     # Call handle_clear_operations
-#     handle_clear_operations(config)
-#
-#     # Verify that clear_data was NOT called
-#     mock_clear_data.assert_not_called()
-#
-#     # Verify that sys.exit was called with 0
-#     mock_exit.assert_called_once_with(0)
-#
-#
-# # 4. validate_and_get_ips Tests
-#
-#
-# @patch("network_latency_monitor.utils.console")
-# def test_validate_and_get_ips_all_valid(mock_console, tmp_path):
-#     config: Dict = {"ip_addresses": ["8.8.8.8", "1.1.1.1"]}
-#
-#     result = validate_and_get_ips(config)
-#     assert result == ["8.8.8.8", "1.1.1.1"]
-#
-#
-# @patch("network_latency_monitor.utils.console")
-# @patch("network_latency_monitor.utils.logging")
-# def test_validate_and_get_ips_some_invalid(mock_logging, mock_console, tmp_path):
-#     config: Dict = {"ip_addresses": ["8.8.8.8", "invalid_ip", "1.1.1.1"]}
-#
-#     result = validate_and_get_ips(config)
-#     assert result == ["8.8.8.8", "1.1.1.1"]
-#     mock_console.print.assert_any_call(
-#         "[bold red]Invalid IP address:[/bold red] invalid_ip"
-#     )
-#     mock_logging.error.assert_called_with("Invalid IP address provided: invalid_ip")
-#
-#
-# @patch("network_latency_monitor.utils.console")
-# @patch("network_latency_monitor.utils.logging")
-# def test_validate_and_get_ips_all_invalid(mock_logging, mock_console, tmp_path):
-#     config: Dict = {"ip_addresses": ["invalid_ip1", "invalid_ip2"]}
-#
-#     with patch("network_latency_monitor.utils.sys.exit") as mock_exit:
-#         validate_and_get_ips(config)
-#         mock_console.print.assert_any_call(
-#             "[bold red]Invalid IP address:[/bold red] invalid_ip1"
-#         )
-#         mock_console.print.assert_any_call(
-#             "[bold red]Invalid IP address:[/bold red] invalid_ip2"
-#         )
-#         mock_console.print.assert_any_call(
-#             "[bold red]No valid IP addresses provided. Exiting.[/bold red]"
-#         )
-#         mock_logging.error.assert_called_with(
-#             "No valid IP addresses provided. Exiting."
-#         )
-#         mock_exit.assert_called_once_with(1)
-#
-#
-# # 5. create_results_directory Tests
-#
-#
-# @patch("network_latency_monitor.utils.console")
-# @patch("network_latency_monitor.utils.logging")
-# def test_create_results_directory_success(mock_logging, mock_console, tmp_path):
-#     config: Dict = {"results_dir": tmp_path / "results"}
-#     config["results_dir"].mkdir()
-#
-#     # Create a fixed datetime object
-#     fixed_datetime = datetime(2024, 10, 9, 15, 33, 23)
-#
-#     with patch("network_latency_monitor.utils.datetime") as mock_datetime:
-#         mock_datetime.now.return_value = fixed_datetime
-#         # Mock strftime to return the desired format
-#         mock_datetime.now.strftime.return_value = "2024-10-09_15-33-23"
-#
-#         # Call create_results_directory
-#         create_results_directory(config)
-#
-#         # Define the expected subfolder path
-#         expected_subfolder = config["results_dir"] / "results_2024-10-09_15-33-23"
-#
-#         # Verify that the subfolder was created
-#         assert expected_subfolder.exists()
-#
-#         # Verify that console.print was called with the correct message
-#         mock_console.print.assert_called_with(
-#             f"[bold green]Created results subdirectory:[/bold green] {expected_subfolder}"
-#         )
-#
-#
-# @patch("network_latency_monitor.utils.console")
-# @patch("network_latency_monitor.utils.logging")
-# def test_create_results_directory_creation_failure(
-#     mock_logging, mock_console, tmp_path
-# ):
-#     config: Dict = {"results_dir": tmp_path / "results"}
-#     config["results_dir"].mkdir()
-#
-#     # Create a fixed datetime object
-#     fixed_datetime = datetime(2024, 10, 9, 15, 33, 23)
-#
-#     with patch("network_latency_monitor.utils.datetime") as mock_datetime:
-#         mock_datetime.now.return_value = fixed_datetime
-#         # Mock strftime to return the desired format
-#         mock_datetime.now.strftime.return_value = "2024-10-09_15-33-23"
-#
-#         with patch(
-#             "network_latency_monitor.utils.Path.mkdir",
-#             side_effect=OSError("Permission denied"),
-#         ):
-#             with patch("network_latency_monitor.utils.sys.exit") as mock_exit:
-#                 # Call create_results_directory
-#                 create_results_directory(config)
-#
-#                 # Define the expected subfolder path
-#                 expected_subfolder = (
-#                     config["results_dir"] / "results_2024-10-09_15-33-23"
-#                 )
-#
-#                 # Verify that console.print was called with the correct failure message
-#                 expected_message = f"[bold red]Failed to create results subdirectory:[/bold red] {expected_subfolder}"
-#                 mock_console.print.assert_any_call(expected_message)
-#
-#                 # Verify that logging.error was called with the correct message
-#                 mock_logging.error.assert_called_with(
-#                     f"Failed to create results subdirectory '{expected_subfolder}': Permission denied"
-#                 )
-#
-#                 # Verify that sys.exit was called with 1
-#                 mock_exit.assert_called_once_with(1)
+# tests/test_utils.py
+
+import pytest
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+from typing import Dict
+
+from network_latency_monitor import utils
+from network_latency_monitor.console_manager import console_proxy
+from network_latency_monitor.utils import (
+    clear_data,
+    ask_confirmation,
+    handle_clear_operations,
+    validate_and_get_ips,
+    create_results_directory,
+)
+
+
+@pytest.fixture
+def console_mock(monkeypatch):
+    """
+    Replace the shared console with a MagicMock so tests can assert on printed messages.
+    """
+    mock_console = MagicMock()
+    monkeypatch.setattr(console_proxy, "console", mock_console)
+    return mock_console
+
+
+@pytest.fixture
+def logger_mock(monkeypatch):
+    """
+    Replace the utils module's logger with a MagicMock so tests can assert on log calls.
+    """
+    mock_logger = MagicMock()
+    monkeypatch.setattr(utils, "logger", mock_logger)
+    return mock_logger
+
+
+@pytest.fixture
+def clear_data_mock(monkeypatch):
+    """
+    Replace clear_data so clear operations never touch the filesystem.
+    """
+    mock_clear_data = MagicMock()
+    monkeypatch.setattr(utils, "clear_data", mock_clear_data)
+    return mock_clear_data
+
+
+@pytest.fixture
+def data_root(shared_tmp, request):
+    """
+    Per-test path under the session directory for tests where clear_data is mocked.
+
+    Nothing is created on disk, since the code under test never touches these paths.
+    """
+    return shared_tmp / request.node.name
+
+
+# 1. clear_data Tests
+
+
+def test_clear_data(tmp_path):
+    # Create temporary directories
+    dir1 = tmp_path / "dir1"
+    dir2 = tmp_path / "dir2"
+    dir1.mkdir()
+    dir2.mkdir()
+
+    assert dir1.exists()
+    assert dir2.exists()
+
+    # Call clear_data
+    clear_data([dir1, dir2])
+
+    # Verify directories are deleted
+    assert not dir1.exists()
+    assert not dir2.exists()
+
+
+def test_clear_data_accepts_str_paths(tmp_path):
+    dir1 = tmp_path / "dir1"
+    (dir1 / "nested").mkdir(parents=True)
+
+    clear_data([str(dir1)])
+
+    assert not dir1.exists()
+
+
+def test_clear_data_folder_not_found(tmp_path, logger_mock):
+    # Create a temporary directory and then remove it to simulate "not found"
+    dir1 = tmp_path / "dir1"
+    dir1.mkdir()
+    dir1.rmdir()
+
+    clear_data([dir1])
+
+    # Verify that a warning was logged
+    logger_mock.warning.assert_called_once_with("Folder not found: {}", dir1)
+
+
+def test_clear_data_permission_error(tmp_path, monkeypatch):
+    dir1 = tmp_path / "dir1"
+    dir1.mkdir()
+
+    def rmtree_side_effect(*args, **kwargs):
+        raise OSError("Permission denied")
+
+    monkeypatch.setattr(utils.shutil, "rmtree", rmtree_side_effect)
+
+    with pytest.raises(OSError, match="Permission denied"):
+        clear_data([dir1])
+
+
+def test_clear_data_multiple_folders_reports_failure(tmp_path, monkeypatch):
+    folders = [tmp_path / "results", tmp_path / "plots", tmp_path / "logs"]
+    for folder in folders:
+        folder.mkdir()
+    real_rmtree = utils.shutil.rmtree
+
+    def rmtree_side_effect(path, *args, **kwargs):
+        if Path(path).name == "plots":
+            raise OSError("Permission denied")
+        real_rmtree(path, *args, **kwargs)
+
+    monkeypatch.setattr(utils.shutil, "rmtree", rmtree_side_effect)
+
+    with pytest.raises(OSError, match="Permission denied"):
+        clear_data(folders)
+
+    # The other folders are still cleared
+    assert not folders[0].exists()
+    assert folders[1].exists()
+    assert not folders[2].exists()
+
+
+# 2. ask_confirmation Tests
+
+
+def test_ask_confirmation_auto_confirm_true():
+    result = ask_confirmation("Are you sure?", auto_confirm=True)
+    assert result is True
+
+
+@pytest.mark.parametrize("answer, expected", [("y", True), ("n", False)])
+def test_ask_confirmation_user_answer(monkeypatch, answer, expected):
+    monkeypatch.setattr(utils.sys.stdin, "isatty", lambda: True, raising=False)
+    mock_ask = MagicMock(return_value=answer)
+    monkeypatch.setattr(utils.Prompt, "ask", mock_ask)
+
+    result = ask_confirmation("Are you sure?", auto_confirm=False)
+
+    assert result is expected
+    mock_ask.assert_called_once_with("Are you sure?", choices=["y", "n"], default="n")
+
+
+@pytest.mark.parametrize(
+    "answer, expected", [("y\n", True), ("YES", True), ("", False), ("maybe", False)]
+)
+def test_ask_confirmation_non_tty_reads_line(monkeypatch, answer, expected):
+    monkeypatch.setattr(utils.sys.stdin, "isatty", lambda: False, raising=False)
+    monkeypatch.setattr("builtins.input", lambda prompt: answer)
+    mock_ask = MagicMock()
+    monkeypatch.setattr(utils.Prompt, "ask", mock_ask)
+
+    assert ask_confirmation("Are you sure?", auto_confirm=False) is expected
+    mock_ask.assert_not_called()
+
+
+# 3. handle_clear_operations Tests
+
+
+def test_handle_clear_operations_clear_all_true(clear_data_mock, data_root):
+    config: Dict = {
+        "clear": True,
+        "results_dir": data_root / "results",
+        "plots_dir": data_root / "plots",
+        "log_dir": data_root / "logs",
+        "cache_dir": data_root / "cache",
+        "yes": True,
+    }
+
+    with pytest.raises(SystemExit) as exc_info:
+        handle_clear_operations(config)
+
+    # Verify that clear_data was called with all directories
+    clear_data_mock.assert_called_once_with(
+        [
+            config["results_dir"],
+            config["plots_dir"],
+            config["log_dir"],
+            config["cache_dir"],
+        ]
+    )
+    assert exc_info.value.code == 0
+
+
+def test_handle_clear_operations_partial_clear(clear_data_mock, monkeypatch, data_root):
+    config: Dict = {
+        "clear": False,
+        "clear_results": True,
+        "clear_plots": False,
+        "clear_logs": True,
+        "results_dir": data_root / "results",
+        "plots_dir": data_root / "plots",
+        "log_dir": data_root / "logs",
+        "cache_dir": data_root / "cache",
+        "yes": False,
+    }
+    monkeypatch.setattr(utils, "ask_confirmation", lambda message, auto_confirm: True)
+
+    with pytest.raises(SystemExit) as exc_info:
+        handle_clear_operations(config)
+
+    # Verify that clear_data was called with selected directories
+    # The ping time cache is cleared along with the results it was built from
+    clear_data_mock.assert_called_once_with(
+        [config["results_dir"], config["log_dir"], config["cache_dir"]]
+    )
+    assert exc_info.value.code == 0
+
+
+def test_handle_clear_operations_cancel(clear_data_mock, monkeypatch, data_root):
+    config: Dict = {
+        "clear": True,
+        "results_dir": data_root / "results",
+        "plots_dir": data_root / "plots",
+        "log_dir": data_root / "logs",
+        "yes": False,
+    }
+    monkeypatch.setattr(utils, "ask_confirmation", lambda message, auto_confirm: False)
+
+    with pytest.raises(SystemExit) as exc_info:
+        handle_clear_operations(config)
+
+    # Verify that clear_data was NOT called
+    clear_data_mock.assert_not_called()
+    assert exc_info.value.code == 0
+
+
+def test_handle_clear_operations_no_flags(clear_data_mock, monkeypatch, data_root):
+    config: Dict = {
+        "clear": False,
+        "clear_results": False,
+        "clear_plots": False,
+        "clear_logs": False,
+        "results_dir": data_root / "results",
+        "plots_dir": data_root / "plots",
+        "log_dir": data_root / "logs",
+    }
+    mock_ask = MagicMock()
+    monkeypatch.setattr(utils, "ask_confirmation", mock_ask)
+
+    # Returns normally instead of exiting
+    handle_clear_operations(config)
+
+    mock_ask.assert_not_called()
+    clear_data_mock.assert_not_called()
+
+
+# 4. validate_and_get_ips Tests
+
+
+def test_validate_and_get_ips_all_valid():
+    config: Dict = {"ip_addresses": ["8.8.8.8", "1.1.1.1"]}
+
+    result = validate_and_get_ips(config)
+    assert result == ["8.8.8.8", "1.1.1.1"]
+
+
+def test_validate_and_get_ips_some_invalid(console_mock, logger_mock):
+    config: Dict = {"ip_addresses": ["8.8.8.8", "invalid_ip", "1.1.1.1"]}
+
+    result = validate_and_get_ips(config)
+    assert result == ["8.8.8.8", "1.1.1.1"]
+    console_mock.print.assert_any_call(
+        "[bold red]Invalid IP address:[/bold red] invalid_ip"
+    )
+    logger_mock.error.assert_called_with("Invalid IP address provided: invalid_ip")
+
+
+def test_validate_and_get_ips_all_invalid(console_mock, logger_mock):
+    config: Dict = {"ip_addresses": ["invalid_ip1", "invalid_ip2"]}
+
+    with pytest.raises(SystemExit) as exc_info:
+        validate_and_get_ips(config)
+
+    console_mock.print.assert_any_call(
+        "[bold red]Invalid IP address:[/bold red] invalid_ip1"
+    )
+    console_mock.print.assert_any_call(
+        "[bold red]Invalid IP address:[/bold red] invalid_ip2"
+    )
+    console_mock.print.assert_any_call(
+        "[bold red]No valid IP addresses provided. Exiting.[/bold red]"
+    )
+    logger_mock.error.assert_called_with("No valid IP addresses provided. Exiting.")
+    assert exc_info.value.code == 1
+
+
+def test_validate_and_get_ips_revalidates_changed_ips():
+    config: Dict = {"ip_addresses": ["8.8.8.8"]}
+    assert validate_and_get_ips(config) == ["8.8.8.8"]
+
+    # A config merged from this one carries the old cache but new addresses
+    merged = {**config, "ip_addresses": ["1.1.1.1", "9.9.9.9"]}
+    assert validate_and_get_ips(merged) == ["1.1.1.1", "9.9.9.9"]
+    assert validate_and_get_ips(config) == ["8.8.8.8"]
+
+
+@pytest.mark.parametrize(
+    "ip, expected",
+    [
+        ("8.8.8.8", True),
+        ("2001:db8::1", True),
+        ("fe80::1%eth0", True),
+        ("256.1.1.1", False),
+        ("010.1.1.1", False),
+        ("0x8.8.8.8", False),
+        ("1.2.3", False),
+        ("invalid_ip", False),
+    ],
+)
+def test_is_valid_ip(ip, expected):
+    assert utils._is_valid_ip(ip) is expected
+
+
+def test_is_valid_ip_caches_strings(monkeypatch):
+    utils._is_valid_ip_str.cache_clear()
+    mock_check = MagicMock(wraps=utils._check_ip)
+    monkeypatch.setattr(utils, "_check_ip", mock_check)
+
+    assert utils._is_valid_ip("9.9.9.9") is True
+    assert utils._is_valid_ip("9.9.9.9") is True
+    assert mock_check.call_count == 1
+
+    # Unhashable values bypass the cache instead of raising TypeError
+    assert utils._is_valid_ip(["9.9.9.9"]) is False
+    assert mock_check.call_count == 2
+
+
+# 5. create_results_directory Tests
+
+
+def fixed_now():
+    return time.strptime("2024-10-09_15-33-23", "%Y-%m-%d_%H-%M-%S")
+
+
+def test_create_results_directory_success(console_mock, tmp_path):
+    config: Dict = {
+        "results_dir": tmp_path / "results",
+    }
+    config["results_dir"].mkdir()
+
+    results_subfolder = create_results_directory(config, _now=fixed_now)
+
+    # Verify that the subfolder was created
+    expected_subfolder = config["results_dir"] / "results_2024-10-09_15-33-23"
+    assert results_subfolder == expected_subfolder
+    assert expected_subfolder.exists()
+
+    # Verify that console.print was called with the correct message
+    console_mock.print.assert_called_with(
+        f"[bold green]Created results subdirectory:[/bold green] {expected_subfolder}"
+    )
+
+
+def test_create_results_directory_creation_failure(
+    console_mock, logger_mock, monkeypatch, tmp_path
+):
+    config: Dict = {
+        "results_dir": tmp_path / "results",
+    }
+    config["results_dir"].mkdir()
+
+    def mkdir_side_effect(*args, **kwargs):
+        raise OSError("Permission denied")
+
+    monkeypatch.setattr(Path, "mkdir", mkdir_side_effect)
+
+    with pytest.raises(SystemExit) as exc_info:
+        create_results_directory(config, _now=fixed_now)
+
+    expected_subfolder = config["results_dir"] / "results_2024-10-09_15-33-23"
+
+    # Verify that console.print was called with the correct failure message
+    console_mock.print.assert_any_call(
+        f"[bold red]Failed to create results subdirectory:[/bold red] {expected_subfolder}"
+    )
+
+    # Verify that logger.error was called with the correct message
+    logger_mock.error.assert_called_with(
+        f"Failed to create results subdirectory '{expected_subfolder}': Permission denied"
+    )
+    assert exc_info.value.code == 1